@@ -0,0 +1,8 @@
+"""
+Ariel eclipse target selection pipeline.
+
+Importing the package is cheap: the scientific stack is only loaded by the
+stage modules (mcmc, regimes, depth, variability, tiers) when used.
+"""
+
+__version__ = '0.1.0'
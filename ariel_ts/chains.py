@@ -0,0 +1,256 @@
+"""
+Compact export of the MCMC chain archive.
+
+``mcs_eclipse_mcmc_chains.npz`` keeps, for every planet, a pickled dict with
+the full post-burn-in flat chain (``samples``, N x 4 float64) and the derived
+``b_occ_samples`` / ``t_eclipse_samples``. With 32 walkers the draws are
+strongly autocorrelated, so most of that archive carries no extra
+information.
+
+The compact export:
+
+- measures the integrated autocorrelation time tau of each chain (emcee,
+  per walker, max over a/Rs, cos i, e, omega and b_occ) and keeps every
+  ceil(thin_factor * tau)-th step of all walkers
+- stores parameters and b_occ as float32, and t_eclipse as float64 offsets
+  from the catalogue transit epoch (absolute JDs in float32 would lose
+  minutes)
+- writes plain concatenated arrays (no pickles), so loading is a handful of
+  array reads
+
+Every planet is checked against its full chain: the median and the 16th /
+84th percentiles of each quantity may move by at most ``tolerance`` posterior
+sigmas, sigma = (p84 - p16) / 2. Where thinning exceeds that, the thinning
+step is halved until it passes (down to no thinning). The per-planet,
+per-quantity errors are returned as a report.
+
+``load_chains`` reads either format and returns the same
+{planet: {'samples', 'b_occ_samples', 't_eclipse_samples'}} mapping.
+"""
+
+import logging
+import math
+
+import numpy as np
+import pandas as pd
+
+# Export defaults
+THIN_FACTOR = 1.0
+TOLERANCE_SIGMA = 0.05
+DEFAULT_NWALKERS = 32
+
+PARAMETERS = ('a_over_rs', 'cos_i', 'eccentricity', 'periastron')
+QUANTITIES = PARAMETERS + ('b_occ', 't_eclipse')
+
+REPORT_COLUMNS = [
+    'Planet', 'quantity', 'tau', 'thin', 'n_full', 'n_compact', 'median_full',
+    'median_error', 'p16_error', 'p84_error', 'max_error_sigma', 'within_tolerance'
+]
+
+
+def load_chains(path):
+    """
+    Load a chains NPZ in either the full (pickled) or the compact format.
+
+    Returns:
+    --------
+    chains : dict
+        Planet -> {'samples', 'b_occ_samples', 't_eclipse_samples'}
+    """
+    with np.load(path, allow_pickle=True) as archive:
+        if 'planets' in archive.files:
+            return _unpack_compact(archive)
+        return {name: archive[name].item() for name in archive.files}
+
+
+def _unpack_compact(archive):
+    planets = archive['planets']
+    offsets = archive['offsets']
+    samples = archive['samples']
+    b_occ = archive['b_occ_samples']
+    t_offset = archive['t_eclipse_offset']
+    epoch = archive['epoch']
+
+    chains = {}
+    for i, name in enumerate(planets):
+        start, stop = offsets[i], offsets[i + 1]
+        chains[str(name)] = {
+            'samples': samples[start:stop],
+            'b_occ_samples': b_occ[start:stop],
+            't_eclipse_samples': epoch[i] + t_offset[start:stop],
+        }
+    return chains
+
+
+def autocorrelation_time(entry, nwalkers=None):
+    """
+    Integrated autocorrelation time (in steps) of one flat chain.
+
+    The flat chain from ``get_chain(flat=True)`` is step-major, so it is
+    reshaped to (n_steps, n_walkers) before estimating tau per walker
+    ensemble; ``nwalkers`` defaults to the entry's 'nwalkers' key, then
+    DEFAULT_NWALKERS. Returns the largest tau over the parameters and b_occ.
+    """
+    from emcee.autocorr import integrated_time
+
+    if nwalkers is None:
+        nwalkers = int(entry.get('nwalkers', DEFAULT_NWALKERS))
+    samples = np.asarray(entry['samples'])
+    n_steps = len(samples) // nwalkers
+    if n_steps * nwalkers != len(samples):
+        raise ValueError(f"Chain length {len(samples)} is not a multiple of nwalkers={nwalkers}")
+
+    series = np.column_stack([samples, entry['b_occ_samples']]).reshape(n_steps, nwalkers, -1)
+    # Constant series (fixed parameters) have no defined tau
+    varying = np.ptp(series, axis=(0, 1)) > 0
+    if not varying.any():
+        return 1.0
+    # quiet=True logs a warning for chains shorter than 50 tau; the estimate
+    # is still what the thinning needs, and the precision check guards it.
+    # Silence only emcee's autocorr logger, not global logging.
+    logger = logging.getLogger('emcee.autocorr')
+    previous = logger.level
+    logger.setLevel(logging.ERROR)
+    try:
+        tau = integrated_time(series[:, :, varying], quiet=True)
+    finally:
+        logger.setLevel(previous)
+    return float(np.nanmax(tau))
+
+
+def thin_indices(n_samples, nwalkers, thin):
+    """Flat indices of every ``thin``-th step, all walkers kept."""
+    steps = np.arange(0, n_samples // nwalkers, thin)
+    return (steps[:, None] * nwalkers + np.arange(nwalkers)[None, :]).ravel()
+
+
+def _quantity_arrays(entry):
+    samples = np.asarray(entry['samples'])
+    arrays = {name: samples[:, j] for j, name in enumerate(PARAMETERS)}
+    arrays['b_occ'] = np.asarray(entry['b_occ_samples'])
+    arrays['t_eclipse'] = np.asarray(entry['t_eclipse_samples'])
+    return arrays
+
+
+def precision_errors(full_entry, compact_entry):
+    """
+    Change in median / 16th / 84th percentile per quantity.
+
+    Returns:
+    --------
+    rows : list of dict
+        quantity, n_full, n_compact, median_full, median_error, p16_error,
+        p84_error, max_error_sigma
+    """
+    full = _quantity_arrays(full_entry)
+    compact = _quantity_arrays(compact_entry)
+
+    rows = []
+    for name in QUANTITIES:
+        p16, p50, p84 = np.percentile(full[name], [16, 50, 84])
+        c16, c50, c84 = np.percentile(compact[name], [16, 50, 84])
+        errors = np.abs([c50 - p50, c16 - p16, c84 - p84])
+        sigma = (p84 - p16) / 2
+        if sigma > 0:
+            max_error_sigma = errors.max() / sigma
+        else:
+            max_error_sigma = 0.0 if errors.max() == 0 else np.inf
+        rows.append({
+            'quantity': name,
+            'n_full': len(full[name]),
+            'n_compact': len(compact[name]),
+            'median_full': p50,
+            'median_error': errors[0],
+            'p16_error': errors[1],
+            'p84_error': errors[2],
+            'max_error_sigma': max_error_sigma,
+        })
+    return rows
+
+
+def compact_entry(entry, epoch, indices):
+    """Thinned, reduced-precision copy of one chain entry (in memory)."""
+    t_offset = np.asarray(entry['t_eclipse_samples'])[indices] - epoch
+    return {
+        'samples': np.asarray(entry['samples'])[indices].astype(np.float32),
+        'b_occ_samples': np.asarray(entry['b_occ_samples'])[indices].astype(np.float32),
+        't_eclipse_offset': t_offset.astype(np.float64),
+        't_eclipse_samples': epoch + t_offset,
+    }
+
+
+def export_compact(chains, epochs, output_npz, nwalkers=DEFAULT_NWALKERS, thin_factor=THIN_FACTOR,
+                   tolerance=TOLERANCE_SIGMA):
+    """
+    Write the compact chain archive and report the precision cost.
+
+    Parameters:
+    -----------
+    chains : dict
+        Full chains, as returned by load_chains
+    epochs : dict
+        Planet -> catalogue transit epoch (BJD); missing planets use the
+        integer part of their median eclipse time
+    output_npz : str
+        Path of the compact archive
+    nwalkers : int
+        Walkers used for the run (chains may override with an 'nwalkers' key)
+    thin_factor : float
+        Thinning step in units of the autocorrelation time
+    tolerance : float
+        Maximum allowed change of median / p16 / p84, in posterior sigmas
+
+    Returns:
+    --------
+    report_df : DataFrame
+        One row per planet and quantity with REPORT_COLUMNS
+    """
+    planets = []
+    offsets = [0]
+    samples, b_occ, t_offset, epoch_list, thin_list, tau_list = [], [], [], [], [], []
+    report_rows = []
+
+    for name, entry in chains.items():
+        walkers = int(entry.get('nwalkers', nwalkers))
+        n_samples = len(entry['samples'])
+        tau = autocorrelation_time(entry, walkers)
+        thin = max(1, math.ceil(thin_factor * tau)) if np.isfinite(tau) else 1
+
+        epoch = epochs.get(name)
+        if epoch is None or not np.isfinite(epoch):
+            epoch = float(np.floor(np.median(entry['t_eclipse_samples'])))
+
+        # Halve the thinning step until every summary number is within tolerance
+        while True:
+            compact = compact_entry(entry, epoch, thin_indices(n_samples, walkers, thin))
+            rows = precision_errors(entry, compact)
+            if thin == 1 or max(row['max_error_sigma'] for row in rows) <= tolerance:
+                break
+            thin = max(1, thin // 2)
+
+        for row in rows:
+            row.update({'Planet': name, 'tau': tau, 'thin': thin,
+                        'within_tolerance': row['max_error_sigma'] <= tolerance})
+        report_rows.extend(rows)
+
+        planets.append(name)
+        samples.append(compact['samples'])
+        b_occ.append(compact['b_occ_samples'])
+        t_offset.append(compact['t_eclipse_offset'])
+        offsets.append(offsets[-1] + len(compact['b_occ_samples']))
+        epoch_list.append(epoch)
+        thin_list.append(thin)
+        tau_list.append(tau)
+
+    np.savez(
+        output_npz,
+        planets=np.array(planets, dtype=str),
+        offsets=np.array(offsets, dtype=np.int64),
+        samples=np.concatenate(samples) if samples else np.empty((0, 4), dtype=np.float32),
+        b_occ_samples=np.concatenate(b_occ) if b_occ else np.empty(0, dtype=np.float32),
+        t_eclipse_offset=np.concatenate(t_offset) if t_offset else np.empty(0),
+        epoch=np.array(epoch_list, dtype=np.float64),
+        thin=np.array(thin_list, dtype=np.int64),
+        tau=np.array(tau_list, dtype=np.float64),
+    )
+    return pd.DataFrame(report_rows, columns=REPORT_COLUMNS)
@@ -0,0 +1,575 @@
+"""
+Command-line entry point: ``ariel-ts <command>``.
+
+Commands
+--------
+mcmc           eclipse impact parameter MCMC (emcee)
+chains         thinned, reduced-precision export of the MCMC chain archive
+regimes        true / grazing / false eclipse probabilities
+depth          bolometric eclipse depth Monte Carlo
+variability    stellar variability estimates
+occultation    transit / occultation probabilities for every MCS and TPC planet
+detectability  eclipse significance vs number of visits, minimum visits per planet
+tiers          Tier 2 / Tier 3 eclipse candidate lists
+tess           TESS variability coverage by Max Tier
+select         filter / rank targets from the joined results tables
+synth          synthetic MCS / TPC catalogue with the real column layout
+scaling        time / memory scaling of the stages on synthetic catalogues
+startup        measure the CLI cold-start time against its budget
+
+Only the standard library is imported at module level. Each command imports
+the scientific stack it needs inside its handler, so quick queries (``tess``,
+``--help``) never pay for numpy/pandas/scipy/emcee.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from . import __version__, paths
+
+# Wall-clock budget for `python -m ariel_ts --version` in a fresh interpreter
+COLD_START_BUDGET_S = 0.3
+
+# Modules the CLI must not import before a command asks for them
+HEAVY_MODULES = (
+    'numpy', 'pandas', 'scipy', 'emcee', 'corner', 'astropy',
+    'matplotlib', 'seaborn',
+)
+
+
+def _require(path, hint=None):
+    if not os.path.exists(path):
+        message = f"Input file not found: {path}"
+        if hint:
+            message += f"\n  {hint}"
+        raise SystemExit(message)
+    return path
+
+
+def _output(args, default_name):
+    return args.output or paths.result_file(default_name)
+
+
+def _read_catalogue(name):
+    import pandas as pd
+
+    return pd.read_csv(_require(paths.raw_file(name)))
+
+
+def cmd_mcmc(args):
+    import numpy as np
+
+    from . import mcmc
+
+    is_mcs = args.dataset == 'mcs'
+    catalogue = _read_catalogue(paths.MCS_KNOWN_CATALOG if is_mcs else paths.MCS_TPC_CATALOG)
+    systems = mcmc.prepare_system_data(catalogue, is_mcs=is_mcs)
+    if args.seed is not None:
+        np.random.seed(args.seed)
+
+    output_csv = _output(args, paths.MCS_MCMC_RESULTS if is_mcs else f"{args.dataset}_eclipse_mcmc.csv")
+    chains_npz = args.chains or os.path.splitext(output_csv)[0] + '_chains.npz'
+    print(f"{len(systems)} {args.dataset.upper()} systems prepared for MCMC")
+    results = mcmc.run_catalogue(
+        systems, output_csv, chains_npz,
+        nwalkers=args.nwalkers, nsteps=args.nsteps, burn_in=args.burn_in,
+        checkpoint_every=args.checkpoint_every, limit=args.limit
+    )
+    print(f"✓ {len(results)} systems in {output_csv}")
+    print(f"✓ Chains saved to {chains_npz}")
+
+
+def cmd_chains(args):
+    from . import chains, mcmc
+
+    is_mcs = args.dataset == 'mcs'
+    chains_npz = _require(
+        args.chains or paths.result_file(paths.MCS_MCMC_CHAINS if is_mcs else f"{args.dataset}_eclipse_mcmc_chains.npz"),
+        hint='Run `ariel-ts mcmc` first.'
+    )
+    output_npz = args.output or os.path.splitext(chains_npz)[0] + '_compact.npz'
+    report_csv = os.path.splitext(output_npz)[0] + '_report.csv'
+
+    catalogue = _read_catalogue(paths.MCS_KNOWN_CATALOG if is_mcs else paths.MCS_TPC_CATALOG)
+    epochs = {s['name']: s['transit_midtime'] for s in mcmc.prepare_system_data(catalogue, is_mcs=is_mcs)}
+
+    start = time.perf_counter()
+    full = chains.load_chains(chains_npz)
+    full_load_s = time.perf_counter() - start
+    print(f"{len(full)} chains loaded from {chains_npz}")
+
+    report_df = chains.export_compact(full, epochs, output_npz, nwalkers=args.nwalkers,
+                                      thin_factor=args.thin_factor, tolerance=args.tolerance)
+    report_df.to_csv(report_csv, index=False)
+
+    start = time.perf_counter()
+    chains.load_chains(output_npz)
+    compact_load_s = time.perf_counter() - start
+
+    per_planet = report_df.drop_duplicates('Planet')
+    full_mb = os.path.getsize(chains_npz) / 1e6
+    compact_mb = os.path.getsize(output_npz) / 1e6
+    print(f"  autocorrelation time: median {per_planet['tau'].median():.1f} steps, "
+          f"max {per_planet['tau'].max():.1f}")
+    print(f"  thinning step: median {per_planet['thin'].median():.0f}")
+    print(f"  size: {full_mb:.1f} MB -> {compact_mb:.1f} MB ({full_mb / compact_mb:.1f}x)")
+    print(f"  load: {full_load_s:.2f} s -> {compact_load_s:.2f} s")
+    print(f"Max change of median / p16 / p84 (posterior sigmas, tolerance {args.tolerance}):")
+    print(report_df.groupby('quantity', sort=False)['max_error_sigma'].max().round(4).to_string())
+    failing = report_df.loc[~report_df['within_tolerance'], 'Planet'].unique()
+    if len(failing):
+        print(f"⚠️  {len(failing)} planets above tolerance even without thinning")
+    print(f"✓ Compact chains saved to: {output_npz}")
+    print(f"✓ Precision report saved to: {report_csv}")
+
+
+def cmd_regimes(args):
+    import pandas as pd
+
+    from . import regimes
+
+    mcmc_df = pd.read_csv(_require(args.mcmc or paths.result_file(paths.MCS_IMPACT_PARAMETER_RESULTS)))
+    catalogue = _read_catalogue(paths.MCS_KNOWN_CATALOG)
+    results_df = regimes.compute_regimes(mcmc_df, catalogue, n_samples=args.samples, seed=args.seed)
+
+    output_path = _output(args, paths.REGIME_PROBABILITIES)
+    results_df.to_csv(output_path, index=False)
+    summary_path = os.path.join(os.path.dirname(output_path), paths.REGIME_SUMMARY)
+    results_df[regimes.SUMMARY_COLUMNS].round(4).to_csv(summary_path, index=False)
+    grazing_path = os.path.join(os.path.dirname(output_path), paths.GRAZING_CANDIDATES)
+    regimes.grazing_candidates(results_df).to_csv(grazing_path, index=False)
+
+    print(results_df['dominant_regime'].value_counts().to_string())
+    print(f"✓ Results saved to: {output_path}")
+    print(f"✓ Summary saved to: {summary_path}")
+    print(f"✓ Grazing candidates saved to: {grazing_path}")
+
+
+def cmd_depth(args):
+    import pandas as pd
+
+    from . import depth
+
+    mcmc_results = pd.concat([
+        pd.read_csv(_require(paths.result_file(paths.MCS_IMPACT_PARAMETER_RESULTS))),
+        pd.read_csv(_require(paths.result_file(paths.TPC_IMPACT_PARAMETER_RESULTS))),
+    ], ignore_index=True)
+    stellar = {
+        **depth.extract_stellar_params(_read_catalogue(paths.MCS_KNOWN_CATALOG), is_mcs=True),
+        **depth.extract_stellar_params(_read_catalogue(paths.MCS_TPC_CATALOG), is_mcs=False),
+    }
+    datasets = ('MCS', 'TPC') if args.dataset == 'all' else (args.dataset.upper(),)
+    systems = depth.merge_systems(mcmc_results, stellar, datasets=datasets)
+    print(f"Systems ready for eclipse depth analysis: {len(systems)}")
+
+    summary_df = depth.compute_depths(systems, n_samples=args.samples, epsilon=args.epsilon, seed=args.seed)
+    output_path = _output(args, paths.ECLIPSE_DEPTHS)
+    summary_df.to_csv(output_path, index=False)
+    print(f"Median eclipse depth: {summary_df['depth_ppm'].median():.0f} ppm")
+    print(f"✓ Results saved to: {output_path}")
+
+
+def cmd_variability(args):
+    import pandas as pd
+
+    from . import variability
+
+    tess_csv = args.tess or paths.raw_file(paths.TESS_VARIABILITY_CATALOG)
+    if os.path.exists(tess_csv):
+        tess = pd.read_csv(tess_csv)
+    else:
+        print(f"⚠️  TESS variability catalogue not found ({tess_csv}); using rotation / stellar-type estimates only")
+        tess = None
+
+    mcs_with_var = variability.estimate_variability(_read_catalogue(paths.MCS_KNOWN_CATALOG), tess)
+    total = len(mcs_with_var)
+    for source in ('TESS_measured', 'rotation_period', 'stellar_type'):
+        count = (mcs_with_var['variability_source'] == source).sum()
+        print(f"  {source}: {count} ({100 * count / total:.1f}%)")
+
+    output_path = _output(args, paths.STELLAR_VARIABILITY)
+    mcs_with_var[variability.OUTPUT_COLUMNS].to_csv(output_path, index=False)
+    print(f"✓ Saved variability estimates to: {output_path}")
+
+
+def cmd_occultation(args):
+    from . import occultation
+
+    mcs = _read_catalogue(paths.MCS_KNOWN_CATALOG) if args.dataset in ('mcs', 'all') else None
+    tpc = _read_catalogue(paths.MCS_TPC_CATALOG) if args.dataset in ('tpc', 'all') else None
+    results_df = occultation.compute_catalogues(mcs, tpc, n_ecc=args.ecc_nodes, n_omega=args.omega_nodes)
+
+    print(results_df.groupby(['Dataset', 'eccentricity_treatment'])[
+        ['prob_transit', 'prob_occultation', 'prob_occultation_given_transit']].median().round(4).to_string())
+    output_path = _output(args, paths.OCCULTATION_PROBABILITIES)
+    results_df.to_csv(output_path, index=False)
+    print(f"✓ {len(results_df)} planets saved to: {output_path}")
+
+
+def cmd_detectability(args):
+    import numpy as np
+    import pandas as pd
+
+    from . import detectability
+
+    mcs = _read_catalogue(paths.MCS_KNOWN_CATALOG) if args.dataset in ('mcs', 'all') else None
+    tpc = _read_catalogue(paths.MCS_TPC_CATALOG) if args.dataset in ('tpc', 'all') else None
+    variability_csv = args.variability or paths.result_file(paths.STELLAR_VARIABILITY)
+    if os.path.exists(variability_csv):
+        variability_df = pd.read_csv(variability_csv)
+    else:
+        print(f"⚠️  Variability estimates not found ({variability_csv}); using stellar-type values")
+        variability_df = None
+
+    targets = detectability.build_targets(mcs, tpc, variability_df)
+    print(f"Detectability grid: {len(targets)} planets x {args.max_visits} visits x {args.samples} samples")
+    results_df, grid = detectability.compute_detectability(
+        targets, max_visits=args.max_visits, n_samples=args.samples, threshold=args.threshold,
+        probability=args.probability, floor_fraction=args.floor_fraction,
+        reference_noise=args.reference_noise, chunk_size=args.chunk_size, seed=args.seed
+    )
+
+    reached = results_df['min_visits'].notna()
+    print(f"  detected within {args.max_visits} visits: {reached.sum()}")
+    print(f"  limited by the variability floor: {results_df['floor_limited'].sum()}")
+    print(results_df[reached].groupby(['Dataset', 'Max Tier'])['min_visits'].median().to_string())
+    output_path = _output(args, paths.DETECTABILITY)
+    results_df.to_csv(output_path, index=False)
+    print(f"✓ Results saved to: {output_path}")
+    if args.grid:
+        np.savez_compressed(args.grid, **grid)
+        print(f"✓ Grid saved to: {args.grid}")
+
+
+def cmd_tiers(args):
+    import pandas as pd
+
+    from . import tiers
+
+    mcmc_df = pd.read_csv(_require(args.mcmc or paths.result_file(paths.MCS_IMPACT_PARAMETER_RESULTS)))
+    regime_df = pd.read_csv(_require(
+        args.regimes or paths.result_file(paths.REGIME_PROBABILITIES),
+        hint='Run `ariel-ts regimes` first.'
+    ))
+    merged_df = tiers.merge_tier_inputs(mcmc_df, regime_df, _read_catalogue(paths.MCS_KNOWN_CATALOG))
+
+    for tier in args.tiers:
+        candidates = tiers.tier_candidates(merged_df, tier)
+        output_path = os.path.join(args.output_dir or paths.results_dir(),
+                                   paths.TIER_CANDIDATES.format(tier=tier))
+        candidates.to_csv(output_path, index=False)
+        print(f"✓ Tier {tier}: {len(candidates)} candidates saved to {output_path}")
+
+
+def cmd_tess(args):
+    from . import tess
+
+    catalogue_csv = _require(paths.raw_file(paths.MCS_KNOWN_CATALOG))
+    tess_csv = _require(
+        args.tess or paths.raw_file(paths.TESS_VARIABILITY_CATALOG),
+        hint='Download the TESS-SVC catalogue into data/raw/ or pass --tess.'
+    )
+    print(tess.coverage_report(tess.coverage_by_tier(catalogue_csv, tess_csv)))
+
+
+def _parse_where(expression):
+    """Turn 'column>=value' into a query() filter."""
+    for op in ('>=', '<=', '==', '>', '<'):
+        column, sep, value = expression.partition(op)
+        if sep:
+            break
+    else:
+        raise SystemExit(f"Cannot parse --where {expression!r}; use e.g. prob_true_eclipse>=0.8")
+    column = column.strip()
+    value = value.strip()
+    if value.upper() in ('TRUE', 'FALSE'):
+        return column, value.upper() == 'TRUE'
+    try:
+        value = float(value)
+    except ValueError:
+        pass
+    if op == '>=':
+        return column, (value, None)
+    if op == '<=':
+        return column, (None, value)
+    if op in ('>', '<'):
+        raise SystemExit("Use inclusive >= / <= in --where")
+    return column, value
+
+
+def _add_filter(filters, column, condition):
+    """
+    Add one query() filter, intersecting with an existing filter on the same column.
+
+    Two ranges combine into their overlap; an equality (or list) filter is
+    kept where the other filter allows it. Filters that can never both hold
+    are an error rather than a silent replacement.
+    """
+    if column not in filters:
+        filters[column] = condition
+        return
+
+    def in_range(value, bounds):
+        low, high = bounds
+        return (low is None or value >= low) and (high is None or value <= high)
+
+    def as_set(value):
+        return set(value) if isinstance(value, (list, set, frozenset)) else {value}
+
+    previous = filters[column]
+    if isinstance(previous, tuple) and isinstance(condition, tuple):
+        lows = [v for v in (previous[0], condition[0]) if v is not None]
+        highs = [v for v in (previous[1], condition[1]) if v is not None]
+        combined = (max(lows) if lows else None, min(highs) if highs else None)
+        if None not in combined and combined[0] > combined[1]:
+            raise SystemExit(f"Conflicting --where ranges on {column}: {previous} and {condition}")
+    elif isinstance(previous, tuple) or isinstance(condition, tuple):
+        bounds, values = (previous, condition) if isinstance(previous, tuple) else (condition, previous)
+        combined = [v for v in as_set(values) if in_range(v, bounds)]
+        if not combined:
+            raise SystemExit(f"Conflicting filters on {column}: {previous} and {condition}")
+    else:
+        combined = as_set(previous) & as_set(condition)
+        if not combined:
+            raise SystemExit(f"Conflicting filters on {column}: {previous} and {condition}")
+    if isinstance(combined, (list, set)):
+        combined = sorted(combined)
+        combined = combined[0] if len(combined) == 1 else combined
+    filters[column] = combined
+
+
+def cmd_select(args):
+    from . import query
+
+    table = query.TargetTable.load(mcmc_csv=args.mcmc)
+    filters = {}
+    for expr in args.where:
+        column, condition = _parse_where(expr)
+        _add_filter(filters, query.resolve_column(column), condition)
+    if args.tier:
+        _add_filter(filters, query.resolve_column('tier'), args.tier)
+
+    start = time.perf_counter()
+    try:
+        result = table.query(top=args.top, by=args.by, ascending=args.ascending, **filters)
+    except (KeyError, ValueError) as error:
+        raise SystemExit(f"select: {error.args[0]}")
+    elapsed = time.perf_counter() - start
+
+    columns = ['Planet', 'Max Tier', 'b_occ_median', 'prob_true_eclipse',
+               'variability_ppm', 'eclipse_depth_ppm']
+    print(result.to_frame(columns).to_string(index=False))
+    print(f"\n{len(result)} of {len(table)} planets ({elapsed * 1e3:.3f} ms)")
+    if args.output:
+        result.to_tier_csv(args.output)
+        print(f"✓ Saved to: {args.output}")
+
+
+def cmd_synth(args):
+    from . import synthetic
+
+    catalog = synthetic.generate_catalog(args.n, kind=args.kind, seed=args.seed)
+    catalog.to_csv(args.output, index=False)
+    print(f"✓ {len(catalog)} synthetic {args.kind.upper()} planets saved to {args.output}")
+
+
+def cmd_scaling(args):
+    from . import scaling
+
+    print(f"Scaling stages {', '.join(args.stages)} at sizes {', '.join(map(str, args.sizes))}")
+    results_df = scaling.run_scaling(
+        sizes=args.sizes, stages=args.stages, mcmc_sizes=args.mcmc_sizes, seed=args.seed,
+        trace_memory=not args.no_memory, repeats=args.repeats,
+        nwalkers=args.nwalkers, nsteps=args.nsteps, burn_in=args.burn_in,
+        regime_samples=args.regime_samples, depth_samples=args.depth_samples,
+    )
+    print()
+    print(scaling.scaling_report(results_df))
+    if args.output:
+        results_df.to_csv(args.output, index=False)
+        print(f"✓ Results saved to: {args.output}")
+
+
+def measure_cold_start(repeats=5):
+    """
+    Time fresh interpreters running ``python -m ariel_ts --version``.
+
+    Returns:
+    --------
+    timings : list of float
+        Wall-clock seconds per run
+    heavy : list of str
+        Heavy modules imported as a side effect of loading the CLI
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [
+        str(Path(__file__).resolve().parent.parent), os.environ.get('PYTHONPATH')
+    ])))
+    command = [sys.executable, '-m', 'ariel_ts', '--version']
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+
+    probe = ("import sys, ariel_ts.cli; "
+             f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    loaded = subprocess.run([sys.executable, '-c', probe], env=env, check=True,
+                            capture_output=True, text=True).stdout.strip()
+    return timings, [m for m in loaded.split(',') if m]
+
+
+def cmd_startup(args):
+    timings, heavy = measure_cold_start(args.repeats)
+    best = min(timings)
+    median = sorted(timings)[len(timings) // 2]
+    print(f"Cold start (python -m ariel_ts --version, {len(timings)} runs):")
+    print(f"  best:   {best * 1000:.0f} ms")
+    print(f"  median: {median * 1000:.0f} ms")
+    print(f"  budget: {args.budget * 1000:.0f} ms")
+    if heavy:
+        print(f"✗ Heavy modules imported at startup: {', '.join(heavy)}")
+    if median > args.budget or heavy:
+        raise SystemExit(1)
+    print("✓ Within budget")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='ariel-ts', description='Ariel eclipse target selection pipeline')
+    parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
+    parser.add_argument('--root', help=f'project root (default: ${paths.ROOT_ENV_VAR} or auto-detected)')
+    sub = parser.add_subparsers(dest='command', metavar='command', required=True)
+
+    p = sub.add_parser('mcmc', help='eclipse impact parameter MCMC')
+    p.add_argument('--dataset', choices=['mcs', 'tpc'], default='mcs')
+    p.add_argument('--nwalkers', type=int, default=32)
+    p.add_argument('--nsteps', type=int, default=3000)
+    p.add_argument('--burn-in', type=int, default=500)
+    p.add_argument('--checkpoint-every', type=int, default=50)
+    p.add_argument('--limit', type=int, help='process at most this many new systems')
+    p.add_argument('--seed', type=int)
+    p.add_argument('--output', help='summary CSV (default: analysis/results/<dataset>_eclipse_mcmc.csv)')
+    p.add_argument('--chains', help='chains NPZ (default: next to --output)')
+    p.set_defaults(func=cmd_mcmc)
+
+    p = sub.add_parser('chains', help='compact (thinned, float32) chain export')
+    p.add_argument('--dataset', choices=['mcs', 'tpc'], default='mcs')
+    p.add_argument('--chains', help=f'full chains NPZ (default: {paths.MCS_MCMC_CHAINS})')
+    p.add_argument('--nwalkers', type=int, default=32, help='walkers of the run (if not stored in the chains)')
+    p.add_argument('--thin-factor', type=float, default=1.0, help='thinning step in autocorrelation times')
+    p.add_argument('--tolerance', type=float, default=0.05,
+                   help='max change of median / p16 / p84 in posterior sigmas')
+    p.add_argument('--output', help='compact NPZ (default: <chains>_compact.npz)')
+    p.set_defaults(func=cmd_chains)
+
+    p = sub.add_parser('regimes', help='occultation regime probabilities')
+    p.add_argument('--mcmc', help=f'MCMC summary CSV (default: {paths.MCS_IMPACT_PARAMETER_RESULTS})')
+    p.add_argument('--samples', type=int, default=100000)
+    p.add_argument('--seed', type=int, default=42)
+    p.add_argument('--output')
+    p.set_defaults(func=cmd_regimes)
+
+    p = sub.add_parser('depth', help='eclipse depth Monte Carlo')
+    p.add_argument('--dataset', choices=['mcs', 'tpc', 'all'], default='tpc')
+    p.add_argument('--samples', type=int, default=10000)
+    p.add_argument('--epsilon', type=float, default=0.8)
+    p.add_argument('--seed', type=int, default=42)
+    p.add_argument('--output')
+    p.set_defaults(func=cmd_depth)
+
+    p = sub.add_parser('variability', help='stellar variability estimates')
+    p.add_argument('--tess', help='TESS variability catalogue CSV')
+    p.add_argument('--output')
+    p.set_defaults(func=cmd_variability)
+
+    p = sub.add_parser('occultation', help='catalogue-wide transit / occultation probabilities')
+    p.add_argument('--dataset', choices=['mcs', 'tpc', 'all'], default='all')
+    p.add_argument('--ecc-nodes', type=int, default=32, help='quadrature nodes in eccentricity')
+    p.add_argument('--omega-nodes', type=int, default=64, help='quadrature nodes in omega')
+    p.add_argument('--output')
+    p.set_defaults(func=cmd_occultation)
+
+    p = sub.add_parser('detectability', help='eclipse significance vs number of visits')
+    p.add_argument('--dataset', choices=['mcs', 'tpc', 'all'], default='all')
+    p.add_argument('--variability', help=f'variability CSV (default: {paths.STELLAR_VARIABILITY})')
+    p.add_argument('--max-visits', type=int, default=100)
+    p.add_argument('--samples', type=int, default=2000, help='depth posterior samples per planet')
+    p.add_argument('--threshold', type=float, default=3.0, help='detection significance (sigma)')
+    p.add_argument('--probability', type=float, default=0.84,
+                   help='fraction of the depth posterior that must reach the threshold')
+    p.add_argument('--floor-fraction', type=float, default=0.01,
+                   help='fraction of variability_ppm used as the noise floor')
+    p.add_argument('--reference-noise', type=float, default=20.0, help='ppm in 1 hr at Ks = 10')
+    p.add_argument('--chunk-size', type=int, default=32, help='planets per array pass')
+    p.add_argument('--seed', type=int, default=42)
+    p.add_argument('--grid', help='also save the full visits grid to this NPZ')
+    p.add_argument('--output')
+    p.set_defaults(func=cmd_detectability)
+
+    p = sub.add_parser('tiers', help='Tier 2 / 3 eclipse candidate lists')
+    p.add_argument('--mcmc', help=f'MCMC summary CSV (default: {paths.MCS_IMPACT_PARAMETER_RESULTS})')
+    p.add_argument('--regimes', help=f'regime probabilities CSV (default: {paths.REGIME_PROBABILITIES})')
+    p.add_argument('--tiers', type=int, nargs='+', default=[2, 3])
+    p.add_argument('--output-dir', help='directory for tier<N>_eclipse_candidates.csv')
+    p.set_defaults(func=cmd_tiers)
+
+    p = sub.add_parser('tess', help='TESS variability coverage by Max Tier')
+    p.add_argument('--tess', help='TESS variability catalogue CSV')
+    p.set_defaults(func=cmd_tess)
+
+    p = sub.add_parser('select', help='filter / rank targets from the results tables')
+    p.add_argument('--where', action='append', default=[],
+                   help="filter such as 'prob_true_eclipse>=0.8' (repeatable)")
+    p.add_argument('--tier', type=int, nargs='+', help='Max Tier value(s)')
+    p.add_argument('--by', default='prob_true_eclipse', help='ranking column')
+    p.add_argument('--ascending', action='store_true')
+    p.add_argument('--top', type=int)
+    p.add_argument('--mcmc', help=f'MCMC summary CSV (default: {paths.MCS_MCMC_RESULTS})')
+    p.add_argument('--output', help='write the selection in the tier candidates CSV schema')
+    p.set_defaults(func=cmd_select)
+
+    p = sub.add_parser('synth', help='synthetic catalogue with the real column layout')
+    p.add_argument('-n', type=int, required=True, help='number of planets')
+    p.add_argument('--kind', choices=['mcs', 'tpc'], default='mcs')
+    p.add_argument('--seed', type=int, default=42)
+    p.add_argument('--output', required=True)
+    p.set_defaults(func=cmd_synth)
+
+    p = sub.add_parser('scaling', help='stage scaling on synthetic catalogues')
+    p.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    p.add_argument('--stages', nargs='+', default=['mcmc', 'regimes', 'depth', 'variability'],
+                   choices=['mcmc', 'regimes', 'depth', 'variability'])
+    p.add_argument('--mcmc-sizes', type=int, nargs='+', default=[100, 1000],
+                   help='sizes for the MCMC stage (real emcee runs, ~0.25 s per system)')
+    p.add_argument('--nwalkers', type=int, default=16)
+    p.add_argument('--nsteps', type=int, default=200)
+    p.add_argument('--burn-in', type=int, default=50)
+    p.add_argument('--regime-samples', type=int, default=10000)
+    p.add_argument('--depth-samples', type=int, default=10000)
+    p.add_argument('--repeats', type=int, default=3, help='timed runs per point (best is kept)')
+    p.add_argument('--no-memory', action='store_true', help='skip the extra tracemalloc run')
+    p.add_argument('--seed', type=int, default=42)
+    p.add_argument('--output', help='results CSV')
+    p.set_defaults(func=cmd_scaling)
+
+    p = sub.add_parser('startup', help='measure CLI cold-start time')
+    p.add_argument('--repeats', type=int, default=5)
+    p.add_argument('--budget', type=float, default=COLD_START_BUDGET_S, help='seconds')
+    p.set_defaults(func=cmd_startup)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.root:
+        paths.set_project_root(args.root)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,311 @@
+"""
+Bolometric eclipse depth Monte Carlo.
+
+Command-line port of ``analysis/notebooks/eclipse_depth_analysis.ipynb``:
+planet temperature from Tessenyi et al. (2012) with a temperature-dependent
+albedo, eclipse depth = (Rp/Rs)^2 (Tp/Ts)^4, with stellar and planetary
+parameters drawn from normal distributions around the catalogue values.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Physical constants
+RSUN_AU = 0.00465047  # R_sun in AU
+RJUP_TO_RSUN = 0.10049  # R_jup / R_sun
+REARTH_TO_RJUP = 1.0 / 11.209
+
+# Albedo switch for the temperature-dependent model (Tessenyi et al. 2012)
+HOT_PLANET_ALBEDO = 0.1
+COOL_PLANET_ALBEDO = 0.3
+ALBEDO_TRANSITION_K = 700.0
+
+SUMMARY_COLUMNS = [
+    'Planet', 'Dataset', 'Eclipse_Observed', 'b_occ', 'T_p_K', 'T_p_err_lower',
+    'T_p_err_upper', 'depth_ppm', 'depth_ppm_err_lower', 'depth_ppm_err_upper',
+    'depth_fractional', 'epsilon'
+]
+
+
+def planet_temperature(T_star, R_star_rsun, a_au, epsilon=0.8, A=None):
+    """
+    Calculate planet equilibrium temperature using Tessenyi et al. (2012).
+
+    T_p = T_star * (sqrt(1 - A) * R_star / (2 * a * epsilon))^(1/2)
+
+    Parameters:
+    -----------
+    T_star : float or array
+        Stellar effective temperature (K)
+    R_star_rsun : float or array
+        Stellar radius (R_sun)
+    a_au : float or array
+        Semi-major axis (AU)
+    epsilon : float, optional
+        Greenhouse effect parameter (default: 0.8)
+    A : float, optional
+        Planetary albedo. If None, A = 0.3 below 700 K and 0.1 above,
+        judged from a first pass with A = 0.1
+
+    Returns:
+    --------
+    T_p : float or array
+        Planet equilibrium temperature (K)
+    """
+    geometry = np.asarray(R_star_rsun) * RSUN_AU / (2 * np.asarray(a_au) * epsilon)
+
+    if A is None:
+        T_p_guess = T_star * (np.sqrt(1 - HOT_PLANET_ALBEDO) * geometry) ** 0.5
+        A = np.where(T_p_guess < ALBEDO_TRANSITION_K, COOL_PLANET_ALBEDO, HOT_PLANET_ALBEDO)
+
+    return T_star * (np.sqrt(1 - A) * geometry) ** 0.5
+
+
+def eclipse_depth(R_p_rjup, R_star_rsun, T_p, T_star):
+    """
+    Calculate bolometric eclipse depth.
+
+    delta_eclipse = (R_p/R_star)^2 * (T_p/T_star)^4
+
+    Returns:
+    --------
+    delta : float or array
+        Eclipse depth (fractional, not ppm)
+    """
+    R_p_rsun = R_p_rjup * RJUP_TO_RSUN
+    return (R_p_rsun / R_star_rsun) ** 2 * (T_p / T_star) ** 4
+
+
+def _mean_error(row, lower_col, upper_col):
+    return (abs(row.get(lower_col, 0)) + abs(row.get(upper_col, 0))) / 2
+
+
+def extract_stellar_params(df, is_mcs=True):
+    """
+    Extract stellar and planetary parameters with 1-sigma errors.
+
+    Missing errors fall back to 2% (T_star), 5% (R_star, R_p) and 3% (a).
+    TPC planet radii are converted from Earth to Jupiter radii.
+
+    Parameters:
+    -----------
+    df : DataFrame
+        Raw MCS or TPC catalogue
+    is_mcs : bool
+        Whether dataframe is MCS (has error columns)
+
+    Returns:
+    --------
+    stellar_dict : dict
+        Planet name -> parameter dict
+    """
+    stellar_dict = {}
+
+    for idx, row in df.iterrows():
+        name = row.get('Planet Name', f'Unknown_{idx}')
+        T_star = row.get('Star Temperature [K]', np.nan)
+        R_star = row.get('Star Radius [Rs]', np.nan)
+        a = row.get('Planet Semi-major Axis [au]', np.nan)
+
+        if is_mcs:
+            R_p = row.get('Planet Radius [Rjup]', np.nan)
+            T_star_err = _mean_error(row, 'Star Temperature Error Lower [K]', 'Star Temperature Error Upper [K]')
+            R_star_err = _mean_error(row, 'Star Radius Error Lower [Rs]', 'Star Radius Error Upper [Rs]')
+            R_p_err = _mean_error(row, 'Planet Radius Error Lower [Rjup]', 'Planet Radius Error Upper [Rjup]')
+            a_err = _mean_error(row, 'Planet Semi-major Axis Error Lower [au]',
+                                'Planet Semi-major Axis Error Upper [au]')
+        else:
+            R_p_earth = row.get('Planet Radius [Re]', np.nan)
+            R_p = R_p_earth * REARTH_TO_RJUP if pd.notna(R_p_earth) else np.nan
+            R_p_err = _mean_error(row, 'Planet Radius Error Lower [Re]',
+                                  'Planet Radius Error Upper [Re]') * REARTH_TO_RJUP
+            T_star_err = R_star_err = a_err = 0
+
+        if pd.isna(T_star_err) or (T_star_err == 0 and pd.notna(T_star)):
+            T_star_err = T_star * 0.02
+        if pd.isna(R_star_err) or (R_star_err == 0 and pd.notna(R_star)):
+            R_star_err = R_star * 0.05
+        if pd.isna(R_p_err) or (R_p_err == 0 and pd.notna(R_p)):
+            R_p_err = R_p * 0.05
+        if pd.isna(a_err) or (a_err == 0 and pd.notna(a)):
+            a_err = a * 0.03
+
+        stellar_dict[name] = {
+            'T_star': T_star,
+            'T_star_err': T_star_err,
+            'R_star': R_star,
+            'R_star_err': R_star_err,
+            'R_p': R_p,
+            'R_p_err': R_p_err,
+            'a': a,
+            'a_err': a_err,
+            'dataset': 'MCS' if is_mcs else 'TPC'
+        }
+
+    return stellar_dict
+
+
+def merge_systems(mcmc_results, stellar, datasets=('TPC',)):
+    """
+    Join MCMC results with stellar parameters, keeping complete systems only.
+
+    Returns:
+    --------
+    systems : list of dict
+        Systems ready for calculate_eclipse_depth_distribution
+    """
+    systems = []
+    for _, row in mcmc_results.iterrows():
+        if row['Dataset'] not in datasets:
+            continue
+        params = stellar.get(row['Planet'])
+        if params is None:
+            continue
+        if any(pd.isna(params[p]) for p in ('T_star', 'R_star', 'R_p', 'a')):
+            continue
+        systems.append({
+            'name': row['Planet'],
+            'dataset': row['Dataset'],
+            'eclipse_observed': row.get('eclipse_observed', None),
+            'b_occ_median': row['b_occ_median'],
+            'b_occ_16': row['b_occ_16'],
+            'b_occ_84': row['b_occ_84'],
+            'k_rp_rs': row['k_rp_rs'],
+            **{key: value for key, value in params.items() if key != 'dataset'}
+        })
+    return systems
+
+
+def calculate_eclipse_depth_distribution(system, n_samples=10000, epsilon=0.8, random_seed=42):
+    """
+    Calculate eclipse depth distribution via Monte Carlo sampling.
+
+    Parameters:
+    -----------
+    system : dict
+        System parameters including stellar params and MCMC results
+    n_samples : int
+        Number of Monte Carlo samples
+    epsilon : float
+        Greenhouse effect parameter (default: 0.8)
+    random_seed : int
+        Random seed for reproducibility
+
+    Returns:
+    --------
+    results : dict
+        Eclipse depth distribution and statistics
+    """
+    np.random.seed(random_seed)
+
+    T_star_samples = np.clip(np.random.normal(system['T_star'], system['T_star_err'], n_samples), 2000, 50000)
+    R_star_samples = np.clip(np.random.normal(system['R_star'], system['R_star_err'], n_samples), 0.08, 50)
+    R_p_samples = np.clip(np.random.normal(system['R_p'], system['R_p_err'], n_samples), 0.01, 30)
+    a_samples = np.clip(np.random.normal(system['a'], system['a_err'], n_samples), 0.001, 100)
+
+    T_p_samples = planet_temperature(T_star_samples, R_star_samples, a_samples, epsilon=epsilon)
+    depth_samples = eclipse_depth(R_p_samples, R_star_samples, T_p_samples, T_star_samples)
+    depth_ppm_samples = depth_samples * 1e6
+
+    depth_median = np.median(depth_samples)
+    depth_16, depth_84 = np.percentile(depth_samples, [16, 84])
+    T_p_median = np.median(T_p_samples)
+    T_p_16, T_p_84 = np.percentile(T_p_samples, [16, 84])
+
+    return {
+        'name': system['name'],
+        'dataset': system['dataset'],
+        'eclipse_observed': system['eclipse_observed'],
+        'b_occ_median': system['b_occ_median'],
+        'T_p_median': T_p_median,
+        'T_p_err_lower': T_p_median - T_p_16,
+        'T_p_err_upper': T_p_84 - T_p_median,
+        'depth_median': depth_median,
+        'depth_16': depth_16,
+        'depth_84': depth_84,
+        'depth_err_lower': depth_median - depth_16,
+        'depth_err_upper': depth_84 - depth_median,
+        'depth_ppm_median': depth_median * 1e6,
+        'depth_ppm_err_lower': (depth_median - depth_16) * 1e6,
+        'depth_ppm_err_upper': (depth_84 - depth_median) * 1e6,
+        'T_p_samples': T_p_samples,
+        'depth_samples': depth_samples,
+        'depth_ppm_samples': depth_ppm_samples,
+        'epsilon': epsilon
+    }
+
+
+def sample_depths_ppm(T_star, T_star_err, R_star, R_star_err, R_p, R_p_err, a, a_err,
+                      n_samples=10000, epsilon=0.8, normals=None):
+    """
+    Eclipse depth posterior samples for many systems at once.
+
+    Array version of calculate_eclipse_depth_distribution (same draws and
+    clipping) for callers that need the samples of a whole catalogue. Draws
+    come from the global numpy random state unless ``normals`` is given.
+
+    Parameters:
+    -----------
+    T_star, T_star_err, R_star, R_star_err, R_p, R_p_err, a, a_err : array, shape (n,)
+        Parameters and 1-sigma errors as in extract_stellar_params
+    n_samples : int
+        Samples per system
+    normals : ndarray, shape (n, 4, n_samples), optional
+        Standard normal draws for (T_star, R_star, R_p, a)
+
+    Returns:
+    --------
+    depth_ppm : ndarray, shape (n, n_samples)
+    """
+    if normals is None:
+        normals = np.random.standard_normal((len(T_star), 4, n_samples))
+
+    def draw(value, err, z, low, high):
+        value = np.asarray(value, dtype=float)[:, None]
+        err = np.asarray(err, dtype=float)[:, None]
+        return np.clip(value + err * z, low, high)
+
+    T_star_samples = draw(T_star, T_star_err, normals[:, 0], 2000, 50000)
+    R_star_samples = draw(R_star, R_star_err, normals[:, 1], 0.08, 50)
+    R_p_samples = draw(R_p, R_p_err, normals[:, 2], 0.01, 30)
+    a_samples = draw(a, a_err, normals[:, 3], 0.001, 100)
+
+    T_p_samples = planet_temperature(T_star_samples, R_star_samples, a_samples, epsilon=epsilon)
+    return eclipse_depth(R_p_samples, R_star_samples, T_p_samples, T_star_samples) * 1e6
+
+
+def compute_depths(systems, n_samples=10000, epsilon=0.8, seed=42):
+    """
+    Run the eclipse depth Monte Carlo for every system.
+
+    System i is seeded with ``seed + i`` (1-based), as in the notebook.
+
+    Returns:
+    --------
+    summary_df : DataFrame
+        One row per system with SUMMARY_COLUMNS
+    """
+    summary_data = []
+    for i, system in enumerate(systems, 1):
+        try:
+            result = calculate_eclipse_depth_distribution(
+                system, n_samples=n_samples, epsilon=epsilon, random_seed=seed + i
+            )
+        except Exception as exc:
+            print(f"ERROR: {system['name']}: {exc}")
+            continue
+        summary_data.append({
+            'Planet': result['name'],
+            'Dataset': result['dataset'],
+            'Eclipse_Observed': result['eclipse_observed'],
+            'b_occ': result['b_occ_median'],
+            'T_p_K': result['T_p_median'],
+            'T_p_err_lower': result['T_p_err_lower'],
+            'T_p_err_upper': result['T_p_err_upper'],
+            'depth_ppm': result['depth_ppm_median'],
+            'depth_ppm_err_lower': result['depth_ppm_err_lower'],
+            'depth_ppm_err_upper': result['depth_ppm_err_upper'],
+            'depth_fractional': result['depth_median'],
+            'epsilon': result['epsilon']
+        })
+    return pd.DataFrame(summary_data, columns=SUMMARY_COLUMNS)
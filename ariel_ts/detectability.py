@@ -0,0 +1,243 @@
+"""
+Eclipse detectability versus number of visits.
+
+Combines the eclipse depth Monte Carlo (``ariel_ts.depth``) with the stellar
+variability estimates (``ariel_ts.variability``) into a detection
+significance for every planet and visit count:
+
+    S/N(N) = depth / sqrt(sigma_visit^2 / N + sigma_floor^2)
+
+- depth: posterior samples from ``depth.sample_depths_ppm``
+- sigma_visit: single-visit white noise on the eclipse depth, scaled from a
+  reference noise level by Ks magnitude and eclipse duration, with an equally
+  long out-of-eclipse baseline: sigma_ref * 10^(0.2 (Ks - Ks_ref)) * sqrt(2 / t_hr)
+- sigma_floor: the part of the stellar variability (``variability_ppm``) that
+  survives detrending of each visit. It does not average down with more
+  visits, so planets with depth < threshold * floor are never detected.
+
+The grid is one ``(n_planets, n_visits, n_samples)`` array pass per chunk of
+planets. For each planet the minimum number of visits is the smallest N at
+which ``S/N >= threshold`` for at least a fraction ``probability`` of the
+depth posterior.
+
+The reference noise and the floor fraction are assumptions of this module,
+not catalogue values; both are parameters of compute_detectability and of
+``ariel-ts detectability``.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import depth
+from .variability import variability_from_type
+
+# Broadband white noise (ppm) in 1 hr for a Ks = 10 star
+REFERENCE_NOISE_PPM_HR = 20.0
+REFERENCE_KS_MAG = 10.0
+
+# Fraction of the variability amplitude left per visit after detrending
+VARIABILITY_FLOOR_FRACTION = 0.01
+
+# Detection: S/N >= SIGMA_THRESHOLD in DETECTION_PROBABILITY of the depth posterior
+SIGMA_THRESHOLD = 3.0
+DETECTION_PROBABILITY = 0.84
+
+MAX_VISITS = 100
+
+# Placeholder magnitudes in the TPC catalogue
+MISSING_MAGNITUDE = 99.0
+
+OUTPUT_COLUMNS = [
+    'Planet', 'Dataset', 'Max Tier', 'depth_ppm_median', 'depth_ppm_16', 'depth_ppm_84',
+    'variability_ppm', 'variability_source', 'visit_noise_ppm', 'noise_floor_ppm',
+    'significance_1_visit', 'significance_max_visits', 'min_visits', 'floor_limited'
+]
+
+
+def visit_noise_ppm(ks_mag, duration_hr, reference_noise=REFERENCE_NOISE_PPM_HR,
+                    reference_mag=REFERENCE_KS_MAG):
+    """Single-visit eclipse depth uncertainty (ppm) from Ks magnitude and eclipse duration."""
+    ks_mag = np.asarray(ks_mag, dtype=float)
+    duration_hr = np.asarray(duration_hr, dtype=float)
+    return reference_noise * 10 ** (0.2 * (ks_mag - reference_mag)) * np.sqrt(2 / duration_hr)
+
+
+def _eclipse_duration_hr(df):
+    duration = pd.to_numeric(df.get('Eclipse Duration E14 [s]'), errors='coerce') / 3600
+    for col in ('Transit Duration [hrs]', 'Transit Duration [hr]'):
+        if col in df.columns:
+            duration = duration.where(duration > 0, pd.to_numeric(df[col], errors='coerce'))
+    return duration.where(duration > 0)
+
+
+def _ks_magnitude(df):
+    """Ks magnitude, with H as fallback; catalogue placeholders (999) count as missing."""
+    magnitude = pd.Series(np.nan, index=df.index)
+    for col in ('Star H Mag', 'Star Ks Mag'):
+        if col in df.columns:
+            values = pd.to_numeric(df[col], errors='coerce')
+            values = values.where(values < MISSING_MAGNITUDE)
+            magnitude = values.fillna(magnitude)
+    return magnitude
+
+
+def build_targets(mcs_df=None, tpc_df=None, variability_df=None):
+    """
+    One row per planet with the depth, noise and variability inputs.
+
+    Depth parameters come from depth.extract_stellar_params. Variability is
+    taken from ``variability_df`` (Planet Name, variability_ppm,
+    variability_source) where available, otherwise from the stellar-type
+    estimate.
+
+    Returns:
+    --------
+    targets : DataFrame
+    """
+    frames = []
+    for df, is_mcs in ((mcs_df, True), (tpc_df, False)):
+        if df is None:
+            continue
+        stellar = depth.extract_stellar_params(df, is_mcs=is_mcs)
+        params = pd.DataFrame.from_dict(stellar, orient='index')
+        params.index.name = 'Planet'
+        catalogue = df.drop_duplicates('Planet Name').set_index('Planet Name')
+        params = params.join(pd.DataFrame({
+            'Max Tier': catalogue['Max Tier'],
+            'ks_mag': _ks_magnitude(catalogue),
+            'duration_hr': _eclipse_duration_hr(catalogue),
+            'logg': pd.to_numeric(catalogue.get('Star log(g)'), errors='coerce'),
+        }))
+        frames.append(params.reset_index().rename(columns={'dataset': 'Dataset'}))
+    targets = pd.concat(frames, ignore_index=True)
+
+    targets['variability_ppm'] = np.nan
+    targets['variability_source'] = 'stellar_type'
+    if variability_df is not None:
+        known = variability_df.drop_duplicates('Planet Name').set_index('Planet Name')
+        targets['variability_ppm'] = targets['Planet'].map(known['variability_ppm'])
+        targets['variability_source'] = targets['Planet'].map(known['variability_source'])
+    missing = targets['variability_ppm'].isna()
+    targets.loc[missing, 'variability_ppm'] = [
+        variability_from_type(T, g) for T, g in zip(targets.loc[missing, 'T_star'], targets.loc[missing, 'logg'])
+    ]
+    targets.loc[missing, 'variability_source'] = 'stellar_type'
+    return targets
+
+
+def significance(depth_ppm, visit_noise, noise_floor, visits):
+    """
+    Detection significance grid.
+
+    Parameters:
+    -----------
+    depth_ppm : ndarray, shape (n, n_samples)
+    visit_noise, noise_floor : ndarray, shape (n,)
+    visits : ndarray, shape (n_visits,)
+
+    Returns:
+    --------
+    snr : ndarray, shape (n, n_visits, n_samples)
+    """
+    sigma = np.sqrt(visit_noise[:, None] ** 2 / visits[None, :] + noise_floor[:, None] ** 2)
+    return depth_ppm[:, None, :] / sigma[:, :, None]
+
+
+def compute_detectability(targets, max_visits=MAX_VISITS, n_samples=2000, threshold=SIGMA_THRESHOLD,
+                          probability=DETECTION_PROBABILITY, floor_fraction=VARIABILITY_FLOOR_FRACTION,
+                          reference_noise=REFERENCE_NOISE_PPM_HR, epsilon=0.8, chunk_size=32, seed=42):
+    """
+    Minimum visits for an eclipse detection, for every planet.
+
+    Parameters:
+    -----------
+    targets : DataFrame
+        Output of build_targets
+    max_visits : int
+        Largest visit count on the grid (1 .. max_visits)
+    n_samples : int
+        Depth posterior samples per planet
+    threshold : float
+        Detection significance (sigma)
+    probability : float
+        Required fraction of the depth posterior above threshold
+    floor_fraction : float
+        Fraction of variability_ppm used as the non-averaging noise floor
+    reference_noise : float
+        White noise (ppm in 1 hr) at Ks = REFERENCE_KS_MAG
+    chunk_size : int
+        Planets per array pass. The float64 S/N block takes
+        chunk_size * max_visits * n_samples * 8 B (51 MB at the defaults) plus
+        a 1 B/element boolean mask; the median is taken in place
+    seed : int
+        Planet i (0-based, in ``targets`` order) uses seed + i for its depth samples
+
+    Returns:
+    --------
+    results_df : DataFrame
+        One row per planet with OUTPUT_COLUMNS; min_visits is NaN when the
+        threshold is not reached within max_visits
+    grid : dict
+        'visits', 'planets', 'detection_probability' (n, n_visits) and
+        'median_significance' (n, n_visits)
+    """
+    n = len(targets)
+    visits = np.arange(1, max_visits + 1)
+
+    visit_noise = visit_noise_ppm(targets['ks_mag'], targets['duration_hr'], reference_noise=reference_noise)
+    noise_floor = floor_fraction * targets['variability_ppm'].to_numpy(dtype=float)
+    depth_inputs = [targets[col].to_numpy(dtype=float) for col in
+                    ('T_star', 'T_star_err', 'R_star', 'R_star_err', 'R_p', 'R_p_err', 'a', 'a_err')]
+
+    detection_probability = np.full((n, max_visits), np.nan)
+    median_significance = np.full((n, max_visits), np.nan)
+    depth_percentiles = np.full((n, 3), np.nan)
+    asymptotic_probability = np.full(n, np.nan)
+
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        # Planet i draws from its own seed (seed + i), so results do not depend on chunk_size
+        normals = np.stack([np.random.RandomState(seed + i).standard_normal((4, n_samples))
+                            for i in range(start, stop)])
+        depth_ppm = depth.sample_depths_ppm(*(values[start:stop] for values in depth_inputs),
+                                            n_samples=n_samples, epsilon=epsilon, normals=normals)
+        snr = significance(depth_ppm, visit_noise[start:stop], noise_floor[start:stop], visits)
+
+        detection_probability[start:stop] = np.mean(snr >= threshold, axis=2)
+        # In place: snr is not needed afterwards, and a copy would double the peak
+        median_significance[start:stop] = np.median(snr, axis=2, overwrite_input=True)
+        depth_percentiles[start:stop] = np.percentile(depth_ppm, [16, 50, 84], axis=1).T
+        asymptotic_probability[start:stop] = np.mean(
+            depth_ppm >= threshold * noise_floor[start:stop, None], axis=1)
+
+    # NaN inputs give NaN S/N, which never passes the threshold
+    valid = np.isfinite(median_significance[:, 0])
+    detection_probability[~valid] = np.nan
+
+    detected = detection_probability >= probability
+    reached = detected.any(axis=1)
+    min_visits = np.where(reached, visits[np.argmax(detected, axis=1)], np.nan)
+
+    results_df = pd.DataFrame({
+        'Planet': targets['Planet'].to_numpy(),
+        'Dataset': targets['Dataset'].to_numpy(),
+        'Max Tier': targets['Max Tier'].to_numpy(),
+        'depth_ppm_median': depth_percentiles[:, 1],
+        'depth_ppm_16': depth_percentiles[:, 0],
+        'depth_ppm_84': depth_percentiles[:, 2],
+        'variability_ppm': targets['variability_ppm'].to_numpy(),
+        'variability_source': targets['variability_source'].to_numpy(),
+        'visit_noise_ppm': visit_noise,
+        'noise_floor_ppm': noise_floor,
+        'significance_1_visit': median_significance[:, 0],
+        'significance_max_visits': median_significance[:, -1],
+        'min_visits': pd.array(min_visits, dtype='Int64'),
+        'floor_limited': valid & (asymptotic_probability < probability),
+    })
+    grid = {
+        'visits': visits,
+        'planets': targets['Planet'].to_numpy(dtype=str),
+        'detection_probability': detection_probability.astype(np.float32),
+        'median_significance': median_significance.astype(np.float32),
+    }
+    return results_df[OUTPUT_COLUMNS], grid
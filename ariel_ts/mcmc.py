@@ -0,0 +1,544 @@
+"""
+Eclipse impact parameter MCMC driver.
+
+Command-line port of ``analysis/notebooks/eclipse_impact_parameter_mcmc.ipynb``:
+informative priors on (a/Rs, cos i, e, omega) from the transit solution, a
+Kipping Beta prior on eccentricity, and derived b_occ / T_eclipse posteriors
+saved per system to CSV (summaries) and NPZ (full chains) with resume support.
+"""
+
+import os
+import time
+
+import emcee
+import numpy as np
+import pandas as pd
+from scipy.stats import beta as beta_dist
+from scipy.stats import norm
+
+# Kipping (2013/2014) Beta prior for short-period planets
+ECC_BETA_ALPHA = 0.867
+ECC_BETA_BETA = 3.03
+
+NDIM = 4  # a/Rs, cos(i), e, omega
+
+
+def eclipse_impact_parameter(a_over_rs, cos_i, eccentricity, periastron_deg):
+    """
+    Calculate the eclipse impact parameter b_occ.
+
+    Formula from Winn (2010):
+    b_occ = (a/R*) * cos(i) * ((1 - e^2) / (1 - e * sin(omega)))
+
+    Parameters:
+    -----------
+    a_over_rs : float or array
+        Scaled semi-major axis (a/R*)
+    cos_i : float or array
+        Cosine of orbital inclination
+    eccentricity : float or array
+        Orbital eccentricity
+    periastron_deg : float or array
+        Argument of periastron in degrees
+
+    Returns:
+    --------
+    b_occ : float or array
+        Eclipse impact parameter (dimensionless)
+    """
+    omega_rad = np.radians(periastron_deg)
+    ecc_factor = (1 - eccentricity**2) / (1 - eccentricity * np.sin(omega_rad))
+    return a_over_rs * cos_i * ecc_factor
+
+
+def eclipse_midtime(transit_midtime, period, eccentricity, periastron_deg):
+    """
+    Calculate the eclipse midtime from transit midtime and orbital parameters.
+
+    Uses the first-order relation (Winn 2010, eq. 33):
+    T_eclipse = T_transit + (P/2) * (1 + (4/pi) * e * cos(omega))
+
+    which reduces to T_transit + P/2 for circular orbits.
+
+    Parameters:
+    -----------
+    transit_midtime : float or array
+        Transit midtime [JD]
+    period : float or array
+        Orbital period [days]
+    eccentricity : float or array
+        Orbital eccentricity
+    periastron_deg : float or array
+        Argument of periastron in degrees
+
+    Returns:
+    --------
+    t_eclipse : float or array
+        Eclipse midtime [JD]
+    """
+    omega_rad = np.radians(periastron_deg)
+    time_offset = (period / 2.0) * (1.0 + (4.0 / np.pi) * eccentricity * np.cos(omega_rad))
+    return transit_midtime + time_offset
+
+
+def prepare_system_data(df, is_mcs=True):
+    """
+    Prepare system data for MCMC analysis.
+
+    Parameters:
+    -----------
+    df : DataFrame
+        Raw MCS or TPC catalogue
+    is_mcs : bool
+        Whether the dataframe is MCS (True) or TPC (False)
+
+    Returns:
+    --------
+    systems : list of dict
+        Systems with required parameters and (asymmetric) uncertainties
+    """
+    systems = []
+
+    for idx, row in df.iterrows():
+        if is_mcs:
+            name = row.get('Planet Name', f'MCS_{idx}')
+            a_over_rs_err_lower = abs(row.get('a/Rs Error Lower', 0))
+            a_over_rs_err_upper = abs(row.get('a/Rs Error Upper', 0))
+            inclination_err_lower = abs(row.get('Inclination Error Lower', 0))
+            inclination_err_upper = abs(row.get('Inclination Error Upper', 0))
+            # Keep NaN as NaN to detect unmeasured values
+            eccentricity_err_lower = row.get('Eccentricity Error Lower', np.nan)
+            eccentricity_err_upper = row.get('Eccentricity Error Upper', np.nan)
+            periastron_err_lower = row.get('Periastron Error Lower', np.nan)
+            periastron_err_upper = row.get('Periastron Error Upper', np.nan)
+            rp_rs_err_lower = abs(row.get('Rp/Rs Error Lower', 0))
+            rp_rs_err_upper = abs(row.get('Rp/Rs Error Upper', 0))
+            # 'Transit Mid Time' has 100% coverage (full JD)
+            transit_midtime = row.get('Transit Mid Time')
+            transit_midtime_err_lower = abs(row.get('Transit Mid Time Error Lower [days]', 0))
+            transit_midtime_err_upper = abs(row.get('Transit Mid Time Error Upper [days]', 0))
+            period_err_lower = abs(row.get('Planet Period Error Lower [days]', 0))
+            period_err_upper = abs(row.get('Planet Period Error Upper [days]', 0))
+            eclipse_flag = row.get('Eclipse Flag', False)
+            if isinstance(eclipse_flag, str):
+                eclipse_flag = eclipse_flag.upper() == 'TRUE'
+        else:
+            # TPC: no uncertainties on geometry, e and omega never measured
+            name = row.get('Planet Name', f'TPC_{idx}')
+            a_over_rs_err_lower = a_over_rs_err_upper = 0.0
+            inclination_err_lower = inclination_err_upper = 0.0
+            eccentricity_err_lower = eccentricity_err_upper = np.nan
+            periastron_err_lower = periastron_err_upper = np.nan
+            rp_rs_err_lower = rp_rs_err_upper = 0.0
+            transit_midtime = row.get('Transit Mid Time [days]')
+            transit_midtime_err_lower = transit_midtime_err_upper = 0.0
+            period_err_lower = period_err_upper = 0.0
+            eclipse_flag = None
+
+        a_over_rs = row.get('a/Rs')
+        inclination = row.get('Inclination')
+        b_tra = row.get('Impact Parameter')
+        eccentricity = row.get('Eccentricity', 0.0)
+        periastron = row.get('Periastron', 0.0)
+        rp_rs = row.get('Rp/Rs')
+        period = row.get('Planet Period [days]')
+
+        if not (pd.notna(a_over_rs) and pd.notna(inclination)):
+            continue
+
+        if pd.isna(eccentricity):
+            eccentricity = 0.0
+        if pd.isna(periastron):
+            periastron = 0.0  # Dataset default (periastron at inferior conjunction)
+        if pd.isna(b_tra):
+            b_tra = a_over_rs * np.cos(np.radians(inclination))
+        if pd.isna(rp_rs):
+            rp_rs = 0.1  # Default placeholder
+
+        if a_over_rs_err_lower + a_over_rs_err_upper == 0:
+            a_over_rs_err_lower = a_over_rs_err_upper = a_over_rs * 0.05
+        if inclination_err_lower + inclination_err_upper == 0:
+            inclination_err_lower = inclination_err_upper = 0.5
+        if rp_rs_err_lower + rp_rs_err_upper == 0:
+            rp_rs_err_lower = rp_rs_err_upper = rp_rs * 0.05
+
+        # Eccentricity / periastron count as measured only with both error bars
+        eccentricity_measured = pd.notna(eccentricity_err_lower) and pd.notna(eccentricity_err_upper)
+        if eccentricity_measured:
+            eccentricity_err_lower = abs(eccentricity_err_lower)
+            eccentricity_err_upper = abs(eccentricity_err_upper)
+        else:
+            eccentricity_err_lower = eccentricity_err_upper = 0.0
+
+        periastron_measured = pd.notna(periastron_err_lower) and pd.notna(periastron_err_upper)
+        if periastron_measured:
+            periastron_err_lower = abs(periastron_err_lower)
+            periastron_err_upper = abs(periastron_err_upper)
+        else:
+            periastron_err_lower = periastron_err_upper = 0.0
+
+        # Propagate inclination uncertainty to cos(i): d(cos i)/di = -sin(i)
+        cos_i = np.cos(np.radians(inclination))
+        sin_i = np.sin(np.radians(inclination))
+        cos_i_err_lower = sin_i * inclination_err_lower * (np.pi / 180.0)
+        cos_i_err_upper = sin_i * inclination_err_upper * (np.pi / 180.0)
+
+        if period_err_lower + period_err_upper == 0:
+            period_err_lower = period_err_upper = period * 1e-6
+        if transit_midtime_err_lower + transit_midtime_err_upper == 0:
+            transit_midtime_err_lower = transit_midtime_err_upper = 0.001
+
+        systems.append({
+            'name': name,
+            'a_over_rs': a_over_rs,
+            'a_over_rs_err_lower': a_over_rs_err_lower,
+            'a_over_rs_err_upper': a_over_rs_err_upper,
+            'b_tra': b_tra,
+            'inclination': inclination,
+            'inclination_err_lower': inclination_err_lower,
+            'inclination_err_upper': inclination_err_upper,
+            'cos_i': cos_i,
+            'cos_i_err_lower': cos_i_err_lower,
+            'cos_i_err_upper': cos_i_err_upper,
+            'eccentricity': eccentricity,
+            'eccentricity_err_lower': eccentricity_err_lower,
+            'eccentricity_err_upper': eccentricity_err_upper,
+            'eccentricity_measured': eccentricity_measured,
+            'periastron': periastron,
+            'periastron_err_lower': periastron_err_lower,
+            'periastron_err_upper': periastron_err_upper,
+            'periastron_measured': periastron_measured,
+            'rp_rs': rp_rs,
+            'rp_rs_err_lower': rp_rs_err_lower,
+            'rp_rs_err_upper': rp_rs_err_upper,
+            'transit_midtime': transit_midtime,
+            'transit_midtime_err_lower': transit_midtime_err_lower,
+            'transit_midtime_err_upper': transit_midtime_err_upper,
+            'period': period,
+            'period_err_lower': period_err_lower,
+            'period_err_upper': period_err_upper,
+            'eclipse_flag': eclipse_flag,
+            'dataset': 'MCS' if is_mcs else 'TPC'
+        })
+
+    return systems
+
+
+def asymmetric_gaussian_logpdf(x, center, err_lower, err_upper):
+    """
+    Log PDF for a split normal: lower error below center, upper error above.
+    """
+    if x < center:
+        return norm.logpdf(x, loc=center, scale=err_lower)
+    return norm.logpdf(x, loc=center, scale=err_upper)
+
+
+def beta_prior_ecc(e, alpha=ECC_BETA_ALPHA, beta=ECC_BETA_BETA):
+    """
+    Kipping-style Beta prior for eccentricity. Returns log probability.
+    """
+    if e < 0.0 or e >= 1.0:
+        return -np.inf
+    lp = beta_dist.logpdf(e, alpha, beta)
+    if not np.isfinite(lp):
+        return -np.inf
+    return lp
+
+
+def log_prior(theta, system):
+    """
+    Log prior with informative priors from the transit solution.
+
+    Parameters:
+    -----------
+    theta : array-like
+        [a_over_rs, cos_i, e, omega_deg]
+    system : dict
+        System parameters and uncertainties (see prepare_system_data)
+
+    Returns:
+    --------
+    log_prob : float
+        Log prior probability
+    """
+    a_over_rs, cos_i, e, omega_deg = theta
+
+    if a_over_rs <= 0.0:
+        return -np.inf
+    if e < 0.0 or e >= 1.0:
+        return -np.inf
+    if omega_deg < 0.0 or omega_deg >= 360.0:
+        return -np.inf
+    # cos(i) in [0, 1] keeps i in [0, 90] deg and b_occ non-negative
+    if cos_i < 0.0 or cos_i > 1.0:
+        return -np.inf
+
+    log_prob = asymmetric_gaussian_logpdf(
+        a_over_rs, system['a_over_rs'],
+        system['a_over_rs_err_lower'], system['a_over_rs_err_upper']
+    )
+    log_prob += asymmetric_gaussian_logpdf(
+        cos_i, system['cos_i'],
+        system['cos_i_err_lower'], system['cos_i_err_upper']
+    )
+
+    # Eccentricity: Beta population prior, times the RV constraint if measured
+    log_prob += beta_prior_ecc(e)
+    if system.get('eccentricity_measured', False):
+        if system['eccentricity_err_lower'] > 0 or system['eccentricity_err_upper'] > 0:
+            log_prob += asymmetric_gaussian_logpdf(
+                e, system['eccentricity'],
+                max(system['eccentricity_err_lower'], 1e-6),
+                max(system['eccentricity_err_upper'], 1e-6)
+            )
+
+    # Periastron: uniform unless measured; wrap the difference to [-180, 180]
+    if system.get('periastron_measured', False):
+        if system['periastron_err_lower'] > 0 or system['periastron_err_upper'] > 0:
+            omega_diff = (omega_deg - system['periastron'] + 180) % 360 - 180
+            log_prob += asymmetric_gaussian_logpdf(
+                omega_diff, 0.0,
+                max(system['periastron_err_lower'], 1e-6),
+                max(system['periastron_err_upper'], 1e-6)
+            )
+
+    return log_prob
+
+
+def log_probability(theta, system):
+    """
+    Log posterior. The likelihood is flat: all constraints live in the priors.
+    """
+    lp = log_prior(theta, system)
+    if not np.isfinite(lp):
+        return -np.inf
+    return lp
+
+
+def _sample_split_normal(center, err_lower, err_upper, size):
+    """Draw from a split normal by picking a side, then a half-normal offset."""
+    offset = np.abs(np.random.randn(size))
+    lower = np.random.rand(size) < 0.5
+    return np.where(lower, center - offset * err_lower, center + offset * err_upper)
+
+
+def run_mcmc_for_system(system, nwalkers=32, nsteps=3000, burn_in=500):
+    """
+    Run MCMC for a single system with informative priors.
+
+    Parameters:
+    -----------
+    system : dict
+        System parameters (see prepare_system_data)
+    nwalkers : int
+        Number of MCMC walkers
+    nsteps : int
+        Number of MCMC steps
+    burn_in : int
+        Number of burn-in steps to discard
+
+    Returns:
+    --------
+    results : dict
+        Samples, derived b_occ / T_eclipse distributions and summary statistics
+    """
+    p0 = np.array([
+        system['a_over_rs'],
+        system['cos_i'],
+        system['eccentricity'],
+        system['periastron']
+    ])
+
+    # Random offsets with a guaranteed minimum spread to avoid linear dependence
+    a_err_avg = (system['a_over_rs_err_lower'] + system['a_over_rs_err_upper']) / 2
+    cos_i_err_avg = (system['cos_i_err_lower'] + system['cos_i_err_upper']) / 2
+    ecc_err_avg = (system['eccentricity_err_lower'] + system['eccentricity_err_upper']) / 2
+    peri_err_avg = (system['periastron_err_lower'] + system['periastron_err_upper']) / 2
+    perturbation_scale = np.array([
+        max(a_err_avg * 0.1, system['a_over_rs'] * 0.01),
+        max(cos_i_err_avg * 0.1, 0.01),
+        max(ecc_err_avg * 0.1, 0.05),
+        max(peri_err_avg * 0.1, 10.0)
+    ])
+
+    pos = p0 + np.random.randn(nwalkers, NDIM) * perturbation_scale
+    pos[:, 0] = np.clip(pos[:, 0], p0[0] * 0.8, p0[0] * 1.2)
+    pos[:, 1] = np.clip(pos[:, 1], 0.0, 1.0)
+    pos[:, 2] = np.clip(pos[:, 2], 0.0, 0.99)
+    pos[:, 3] = pos[:, 3] % 360.0
+
+    sampler = emcee.EnsembleSampler(nwalkers, NDIM, log_probability, args=(system,))
+    sampler.run_mcmc(pos, nsteps, progress=False)
+    samples = sampler.get_chain(discard=burn_in, flat=True)
+
+    a_over_rs, cos_i, e, omega = samples.T
+    cos_i_clipped = np.clip(cos_i, -1.0, 1.0)
+    i_deg_samples = np.degrees(np.arccos(cos_i_clipped))
+    b_occ_samples = eclipse_impact_parameter(a_over_rs, cos_i_clipped, e, omega)
+
+    # Eclipse midtime: propagate transit-ephemeris uncertainty per sample
+    n = len(samples)
+    t_tra_samples = _sample_split_normal(
+        system['transit_midtime'], system['transit_midtime_err_lower'],
+        system['transit_midtime_err_upper'], n
+    )
+    period_samples = _sample_split_normal(
+        system['period'], system['period_err_lower'], system['period_err_upper'], n
+    )
+    t_eclipse_samples = eclipse_midtime(t_tra_samples, period_samples, e, omega)
+
+    b_occ_median = np.median(b_occ_samples)
+    b_occ_16, b_occ_84 = np.percentile(b_occ_samples, [16, 84])
+    t_eclipse_median = np.median(t_eclipse_samples)
+    t_eclipse_16, t_eclipse_84 = np.percentile(t_eclipse_samples, [16, 84])
+    i_median = np.median(i_deg_samples)
+    i_16, i_84 = np.percentile(i_deg_samples, [16, 84])
+
+    # 100 quantiles capture non-Gaussian posterior shapes in the CSV
+    quantile_grid = np.linspace(0, 100, 100)
+
+    return {
+        'name': system['name'],
+        'dataset': system['dataset'],
+        'eclipse_flag': system['eclipse_flag'],
+        'samples': samples,
+        'b_occ_samples': b_occ_samples,
+        'b_occ_quantiles': np.percentile(b_occ_samples, quantile_grid),
+        't_eclipse_samples': t_eclipse_samples,
+        't_eclipse_quantiles': np.percentile(t_eclipse_samples, quantile_grid),
+        'i_deg_samples': i_deg_samples,
+        'b_occ_median': b_occ_median,
+        'b_occ_std': np.std(b_occ_samples),
+        'b_occ_16': b_occ_16,
+        'b_occ_84': b_occ_84,
+        'b_occ_err_lower': b_occ_median - b_occ_16,
+        'b_occ_err_upper': b_occ_84 - b_occ_median,
+        't_eclipse_median': t_eclipse_median,
+        't_eclipse_std': np.std(t_eclipse_samples),
+        't_eclipse_16': t_eclipse_16,
+        't_eclipse_84': t_eclipse_84,
+        't_eclipse_err_lower': t_eclipse_median - t_eclipse_16,
+        't_eclipse_err_upper': t_eclipse_84 - t_eclipse_median,
+        'i_median': i_median,
+        'i_err_lower': i_median - i_16,
+        'i_err_upper': i_84 - i_median,
+        'k': system['rp_rs'],
+        'acceptance_fraction': np.mean(sampler.acceptance_fraction)
+    }
+
+
+def summary_row(result):
+    """Flatten an MCMC result into a row of mcs_eclipse_mcmc.csv."""
+    return {
+        'Planet': result['name'],
+        'Dataset': result['dataset'],
+        'eclipse_observed': result['eclipse_flag'],
+        'b_occ_median': result['b_occ_median'],
+        'b_occ_16': result['b_occ_16'],
+        'b_occ_84': result['b_occ_84'],
+        'b_occ_std': result['b_occ_std'],
+        'b_occ_err_lower': result['b_occ_err_lower'],
+        'b_occ_err_upper': result['b_occ_err_upper'],
+        'b_occ_quantiles': ','.join(f"{q:.6f}" for q in result['b_occ_quantiles']),
+        't_eclipse_median': result['t_eclipse_median'],
+        't_eclipse_16': result['t_eclipse_16'],
+        't_eclipse_84': result['t_eclipse_84'],
+        't_eclipse_std': result['t_eclipse_std'],
+        't_eclipse_err_lower': result['t_eclipse_err_lower'],
+        't_eclipse_err_upper': result['t_eclipse_err_upper'],
+        't_eclipse_quantiles': ','.join(f"{q:.6f}" for q in result['t_eclipse_quantiles']),
+        'k_rp_rs': result['k'],
+        'one_minus_k': 1 - result['k'],
+        'one_plus_k': 1 + result['k'],
+        'acceptance_fraction': result['acceptance_fraction']
+    }
+
+
+def _load_existing(output_csv, chains_npz):
+    """Load previous CSV/NPZ output for resume mode and check they agree."""
+    results_list = []
+    chains_dict = {}
+    csv_exists = os.path.exists(output_csv)
+    npz_exists = os.path.exists(chains_npz)
+
+    if csv_exists:
+        results_list = pd.read_csv(output_csv).to_dict('records')
+    if npz_exists:
+        try:
+            with np.load(chains_npz, allow_pickle=True) as existing:
+                chains_dict = {name: existing[name].item() for name in existing.files}
+        except Exception as exc:
+            raise RuntimeError(f"Chains file is corrupted, delete it and rerun: {chains_npz}") from exc
+
+    if npz_exists and not csv_exists:
+        raise RuntimeError(f"NPZ exists but CSV missing - delete {chains_npz} and rerun")
+    if csv_exists and npz_exists:
+        csv_names = {r['Planet'] for r in results_list}
+        if csv_names != set(chains_dict):
+            raise RuntimeError(
+                f"CSV and NPZ files out of sync ({len(csv_names)} vs {len(chains_dict)} systems) "
+                f"- delete {output_csv} and {chains_npz} and rerun"
+            )
+    elif csv_exists:
+        print(f"⚠️  {output_csv} exists but chains are missing; NPZ will only hold new systems")
+
+    return results_list, chains_dict
+
+
+def run_catalogue(systems, output_csv, chains_npz, nwalkers=32, nsteps=3000, burn_in=500,
+                  checkpoint_every=50, limit=None):
+    """
+    Run MCMC over a list of systems in resume mode.
+
+    Systems already present in ``output_csv`` are skipped. Results are
+    checkpointed every ``checkpoint_every`` new systems.
+
+    Returns:
+    --------
+    results_df : DataFrame
+        All summary rows (existing and new)
+    """
+    results_list, chains_dict = _load_existing(output_csv, chains_npz)
+    processed = {r['Planet'] for r in results_list}
+    to_process = [s for s in systems if s['name'] not in processed]
+    if limit is not None:
+        to_process = to_process[:limit]
+
+    print(f"Processing {len(to_process)} new systems (skipping {len(processed)} existing)")
+
+    def save():
+        pd.DataFrame(results_list).to_csv(output_csv, index=False)
+        np.savez_compressed(chains_npz, **chains_dict)
+
+    start = time.time()
+    new_count = 0
+    for i, system in enumerate(to_process, 1):
+        try:
+            planet_start = time.time()
+            result = run_mcmc_for_system(system, nwalkers=nwalkers, nsteps=nsteps, burn_in=burn_in)
+        except Exception as exc:
+            print(f"ERROR processing {system['name']}: {exc}")
+            continue
+
+        results_list.append(summary_row(result))
+        chains_dict[result['name']] = {
+            'samples': result['samples'],
+            'b_occ_samples': result['b_occ_samples'],
+            't_eclipse_samples': result['t_eclipse_samples'],
+            'nwalkers': nwalkers
+        }
+        new_count += 1
+
+        avg_time = (time.time() - start) / new_count
+        remaining = avg_time * (len(to_process) - i) / 60
+        print(f"✓ [{i}/{len(to_process)}] {system['name']} - {time.time() - planet_start:.1f}s "
+              f"(avg: {avg_time:.1f}s, ETA: {remaining:.1f} min)")
+
+        if new_count % checkpoint_every == 0:
+            save()
+            print(f"  Checkpoint saved: {new_count} systems (CSV + NPZ chains)")
+
+    if results_list:
+        save()
+
+    return pd.DataFrame(results_list)
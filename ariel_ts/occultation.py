@@ -0,0 +1,260 @@
+"""
+Catalogue-wide transit and occultation probabilities.
+
+Batch replacement for the ``OccultationCalculator`` in ``analysis/impact.ipynb``.
+Instead of one hand-entered system per call, every MCS and TPC planet is
+evaluated in a single array pass from the catalogue columns:
+
+    P_tra = (1 + k) / (a/Rs) * (1 + e sin w) / (1 - e^2)
+    P_occ = (1 + k) / (a/Rs) * (1 - e sin w) / (1 - e^2)
+
+with k = Rp/Rs, both capped at 1. The e/w convention is the one used for b_occ
+in ``ariel_ts.mcmc`` (b_tra = b (1 - e^2)/(1 + e sin w), b_occ = b (1 - e^2)/
+(1 - e sin w)), so a planet with P_occ = 1 has b_occ < 1 + k for every
+inclination. The notebook's single factor (1 + e sin w) is P_tra in this
+convention; for circular orbits the two coincide.
+
+For an isotropic orbit orientation both events happen when cos i is below
+the smaller threshold, so P(occultation | transit) = E[min(P_tra, P_occ)] /
+E[P_tra]. This is the relevant number for the (transiting) Ariel targets.
+
+Where eccentricity is not measured (no error bars, as in ``mcmc``) the
+probabilities are marginalised over the Kipping (2013) Beta(0.867, 3.03)
+prior, truncated so that the planet clears the star at periastron
+(e < 1 - (1 + k)/(a/Rs)), and over uniform w. Measured e with unmeasured w is
+marginalised over w only. The integrals use Gauss-Legendre quadrature in
+u = e^alpha (which removes the e^(alpha - 1) singularity of the prior) and an
+equally spaced grid in w, evaluated for all planets at once.
+"""
+
+import numpy as np
+import pandas as pd
+
+# OccultationCalculator constants (SI)
+R_SUN_M = 6.96e8
+R_EARTH_M = 6.37e6
+R_JUPITER_M = 7.15e7
+AU_M = 1.496e11
+M_SUN_KG = 1.989e30
+G_SI = 6.67430e-11
+
+# Kipping (2013) Beta prior on eccentricity
+ECC_BETA_ALPHA = 0.867
+ECC_BETA_BETA = 3.03
+
+# Quadrature sizes
+N_ECC_NODES = 32
+N_OMEGA_NODES = 64
+
+OUTPUT_COLUMNS = [
+    'Planet', 'Dataset', 'a_over_rs', 'k_rp_rs', 'eccentricity', 'periastron',
+    'eccentricity_treatment', 'prob_transit_circular', 'prob_transit',
+    'prob_occultation', 'prob_occultation_given_transit'
+]
+
+
+def stellar_radius_from_mass(M_star):
+    """Main-sequence radius in solar radii: M^0.8 below 1.66 Msun, M^0.57 above."""
+    M_star = np.asarray(M_star, dtype=float)
+    return np.where(M_star < 1.66, M_star ** 0.8, M_star ** 0.57)
+
+
+def semi_major_axis(period_days, M_star_solar):
+    """Semi-major axis in AU from Kepler's third law."""
+    P_seconds = np.asarray(period_days, dtype=float) * 24 * 3600
+    M_star_kg = np.asarray(M_star_solar, dtype=float) * M_SUN_KG
+    a_meters = (G_SI * M_star_kg * P_seconds ** 2 / (4 * np.pi ** 2)) ** (1 / 3)
+    return a_meters / AU_M
+
+
+def _column(df, name):
+    if name not in df.columns:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[name], errors='coerce').to_numpy(dtype=float)
+
+
+def _measured(df, name):
+    """Value counts as measured only with both error bars (as in mcmc)."""
+    lower, upper = f"{name} Error Lower", f"{name} Error Upper"
+    if lower not in df.columns or upper not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    return (df[lower].notna() & df[upper].notna()).to_numpy()
+
+
+def catalogue_geometry(df, is_mcs=True):
+    """
+    Per-planet inputs for the probability pass.
+
+    a/Rs and Rp/Rs come straight from the catalogue. Missing values fall back
+    to the notebook route: a from the period and stellar mass (Kepler),
+    R* from the stellar radius column or the mass-radius relation, Rp from
+    the planet radius.
+
+    Returns:
+    --------
+    geometry : DataFrame
+        Planet, Dataset, a_over_rs, k_rp_rs, eccentricity, periastron,
+        eccentricity_measured, periastron_measured
+    """
+    a_over_rs = _column(df, 'a/Rs')
+    k = _column(df, 'Rp/Rs')
+
+    R_star = _column(df, 'Star Radius [Rs]')
+    M_star = _column(df, 'Star Mass [Ms]')
+    R_star = np.where(np.isfinite(R_star), R_star, stellar_radius_from_mass(M_star))
+
+    a_au = _column(df, 'Planet Semi-major Axis [au]')
+    a_au = np.where(np.isfinite(a_au), a_au, semi_major_axis(_column(df, 'Planet Period [days]'), M_star))
+    a_over_rs = np.where(np.isfinite(a_over_rs), a_over_rs, a_au * AU_M / (R_star * R_SUN_M))
+
+    R_p_earth = _column(df, 'Planet Radius [Re]')
+    R_p_earth = np.where(np.isfinite(R_p_earth), R_p_earth,
+                         _column(df, 'Planet Radius [Rjup]') * R_JUPITER_M / R_EARTH_M)
+    k = np.where(np.isfinite(k), k, R_p_earth * R_EARTH_M / (R_star * R_SUN_M))
+
+    if is_mcs:
+        eccentricity_measured = _measured(df, 'Eccentricity')
+        periastron_measured = _measured(df, 'Periastron')
+    else:
+        # TPC: e and omega never measured
+        eccentricity_measured = periastron_measured = np.zeros(len(df), dtype=bool)
+
+    eccentricity = np.nan_to_num(_column(df, 'Eccentricity'))
+    periastron = np.nan_to_num(_column(df, 'Periastron'))
+
+    return pd.DataFrame({
+        'Planet': df['Planet Name'].to_numpy(),
+        'Dataset': 'MCS' if is_mcs else 'TPC',
+        'a_over_rs': a_over_rs,
+        'k_rp_rs': k,
+        'eccentricity': np.where(eccentricity_measured, eccentricity, np.nan),
+        'periastron': np.where(eccentricity_measured & periastron_measured, periastron, np.nan),
+        'eccentricity_measured': eccentricity_measured,
+        'periastron_measured': periastron_measured,
+    })
+
+
+def _eccentricity_nodes(e_max, n_nodes, alpha=ECC_BETA_ALPHA, beta=ECC_BETA_BETA):
+    """
+    Quadrature nodes and normalised weights for the Beta prior on [0, e_max].
+
+    With u = e^alpha the prior density e^(alpha-1) (1-e)^(beta-1) de becomes
+    (1/alpha) (1 - u^(1/alpha))^(beta-1) du, which is smooth, so plain
+    Gauss-Legendre on [0, e_max^alpha] converges quickly.
+
+    Returns:
+    --------
+    e_nodes, weights : ndarray, shape (n_planets, n_nodes)
+    """
+    x, w = np.polynomial.legendre.leggauss(n_nodes)
+    u_max = e_max[:, None] ** alpha
+    u = 0.5 * (x[None, :] + 1) * u_max
+    e_nodes = u ** (1 / alpha)
+    weights = 0.5 * w[None, :] * u_max * (1 - e_nodes) ** (beta - 1)
+    total = weights.sum(axis=1, keepdims=True)
+    weights = np.divide(weights, total, out=np.zeros_like(weights), where=total > 0)
+    return e_nodes, weights
+
+
+def marginal_probabilities(a_over_rs, k, eccentricity, periastron,
+                           n_ecc=N_ECC_NODES, n_omega=N_OMEGA_NODES):
+    """
+    Transit / occultation probabilities for arrays of planets.
+
+    NaN eccentricity means "marginalise over the Beta prior", NaN periastron
+    means "marginalise over uniform w"; finite values are used as given.
+
+    Parameters:
+    -----------
+    a_over_rs, k, eccentricity, periastron : array-like, shape (n,)
+        Scaled semi-major axis, Rp/Rs, e and w in degrees
+
+    Returns:
+    --------
+    prob_transit, prob_occultation, prob_occultation_given_transit : ndarray
+    """
+    a_over_rs = np.asarray(a_over_rs, dtype=float)
+    k = np.asarray(k, dtype=float)
+    eccentricity = np.asarray(eccentricity, dtype=float)
+    periastron = np.asarray(periastron, dtype=float)
+    n = len(a_over_rs)
+
+    # Eccentricity nodes: Beta prior truncated at star-grazing periastron
+    e_max = np.clip(1 - (1 + k) / a_over_rs, 0.0, 1.0)
+    e_max = np.where(np.isfinite(e_max), e_max, 0.0)
+    e_nodes, e_weights = _eccentricity_nodes(e_max, n_ecc)
+    fixed_e = np.isfinite(eccentricity) | (e_max == 0)
+    e_nodes[fixed_e] = np.nan_to_num(eccentricity[fixed_e])[:, None]
+    e_weights[fixed_e] = 1.0 / n_ecc
+
+    # Omega nodes: midpoints of a uniform grid (exact for trigonometric polynomials)
+    omega_grid = 2 * np.pi * (np.arange(n_omega) + 0.5) / n_omega
+    sin_omega = np.broadcast_to(np.sin(omega_grid), (n, n_omega)).copy()
+    fixed_omega = np.isfinite(periastron)
+    sin_omega[fixed_omega] = np.sin(np.radians(periastron[fixed_omega]))[:, None]
+
+    # (n, n_ecc, n_omega) grid
+    e = e_nodes[:, :, None]
+    e_sin_omega = e * sin_omega[:, None, :]
+    base = ((1 + k) / a_over_rs)[:, None, None] / (1 - e ** 2)
+    p_tra = np.minimum(base * (1 + e_sin_omega), 1.0)
+    p_occ = np.minimum(base * (1 - e_sin_omega), 1.0)
+    p_both = np.minimum(p_tra, p_occ)
+
+    weights = e_weights / n_omega
+    prob_transit = np.einsum('nij,ni->n', p_tra, weights)
+    prob_occultation = np.einsum('nij,ni->n', p_occ, weights)
+    prob_both = np.einsum('nij,ni->n', p_both, weights)
+    prob_given_transit = np.divide(prob_both, prob_transit,
+                                   out=np.full(n, np.nan), where=prob_transit > 0)
+    return prob_transit, prob_occultation, prob_given_transit
+
+
+def compute_probabilities(geometry, chunk_size=5000, n_ecc=N_ECC_NODES, n_omega=N_OMEGA_NODES):
+    """
+    Run the probability pass over a geometry table in chunks.
+
+    Parameters:
+    -----------
+    geometry : DataFrame
+        Output of catalogue_geometry (one or several catalogues concatenated)
+    chunk_size : int
+        Planets per array pass (memory ~ chunk_size * n_ecc * n_omega * 40 B)
+
+    Returns:
+    --------
+    results_df : DataFrame
+        One row per planet with OUTPUT_COLUMNS, keyed by ``Planet``
+    """
+    n = len(geometry)
+    columns = {name: np.full(n, np.nan) for name in
+               ('prob_transit', 'prob_occultation', 'prob_occultation_given_transit')}
+    inputs = [geometry[col].to_numpy(dtype=float)
+              for col in ('a_over_rs', 'k_rp_rs', 'eccentricity', 'periastron')]
+
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        chunk = marginal_probabilities(*(values[start:stop] for values in inputs),
+                                       n_ecc=n_ecc, n_omega=n_omega)
+        for name, values in zip(columns, chunk):
+            columns[name][start:stop] = values
+
+    results_df = geometry.copy()
+    results_df['eccentricity_treatment'] = np.where(
+        geometry['eccentricity_measured'],
+        np.where(geometry['periastron_measured'], 'measured', 'measured_e_marginal_w'),
+        'beta_prior'
+    )
+    results_df['prob_transit_circular'] = np.minimum((1 + results_df['k_rp_rs']) / results_df['a_over_rs'], 1.0)
+    for name, values in columns.items():
+        results_df[name] = values
+    return results_df[OUTPUT_COLUMNS]
+
+
+def compute_catalogues(mcs_df=None, tpc_df=None, **kwargs):
+    """Geometry + probabilities for the MCS and/or TPC catalogues in one pass."""
+    geometry = pd.concat([
+        catalogue_geometry(df, is_mcs=is_mcs)
+        for df, is_mcs in ((mcs_df, True), (tpc_df, False)) if df is not None
+    ], ignore_index=True)
+    return compute_probabilities(geometry, **kwargs)
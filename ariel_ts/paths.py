@@ -0,0 +1,96 @@
+"""
+Project-root-independent paths for catalogues and results.
+
+The notebooks and scripts address files relative to their own directory
+('../../data/raw/...', '../results'), so they only work when launched from
+one specific folder. Everything in this package resolves paths against the
+project root instead, found in this order:
+
+1. the ARIEL_TS_ROOT environment variable (or ``ariel-ts --root``)
+2. the checkout containing this package (editable installs)
+3. the current working directory or any of its parents
+
+This module deliberately imports only the standard library so that it is
+cheap to load from the command-line entry point.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+ROOT_ENV_VAR = 'ARIEL_TS_ROOT'
+
+# Catalogue and auxiliary input files (data/raw/)
+MCS_KNOWN_CATALOG = 'Ariel_MCS_Known_2025-07-18.csv'
+MCS_TPC_CATALOG = 'Ariel_MCS_TPCs_2025-07-18.csv'
+TESS_VARIABILITY_CATALOG = 'hlsp_tess-svc_tess_lcf_all-s0001-s0026_tess_v1.0_cat.csv'
+
+# Pipeline outputs (analysis/results/)
+MCS_MCMC_RESULTS = 'mcs_eclipse_mcmc.csv'
+MCS_MCMC_CHAINS = 'mcs_eclipse_mcmc_chains.npz'
+MCS_IMPACT_PARAMETER_RESULTS = 'mcs_eclipse_impact_parameter_mcmc.csv'
+TPC_IMPACT_PARAMETER_RESULTS = 'tpc_eclipse_impact_parameter_mcmc.csv'
+REGIME_PROBABILITIES = 'mcs_occultation_regime_probabilities.csv'
+REGIME_SUMMARY = 'mcs_occultation_regime_summary.csv'
+GRAZING_CANDIDATES = 'mcs_grazing_candidates.csv'
+ECLIPSE_DEPTHS = 'eclipse_depth_analysis.csv'
+OCCULTATION_PROBABILITIES = 'occultation_probabilities.csv'
+DETECTABILITY = 'eclipse_detectability.csv'
+STELLAR_VARIABILITY = 'mcs_stellar_variability_estimates.csv'
+TIER_CANDIDATES = 'tier{tier}_eclipse_candidates.csv'
+
+
+def _is_project_root(path):
+    return (path / 'data' / 'raw').is_dir() and (path / 'analysis').is_dir()
+
+
+@lru_cache(maxsize=None)
+def project_root():
+    """
+    Locate the project root directory.
+
+    Returns:
+    --------
+    root : Path
+        Directory containing ``data/raw`` and ``analysis/``
+    """
+    env_root = os.environ.get(ROOT_ENV_VAR)
+    if env_root:
+        return Path(env_root).expanduser().resolve()
+
+    package_parent = Path(__file__).resolve().parent.parent
+    if _is_project_root(package_parent):
+        return package_parent
+
+    cwd = Path.cwd().resolve()
+    for candidate in (cwd, *cwd.parents):
+        if _is_project_root(candidate):
+            return candidate
+
+    # Nothing found: fall back to the checkout so error messages point
+    # somewhere sensible rather than to an arbitrary working directory
+    return package_parent
+
+
+def set_project_root(path):
+    """Override the project root for the rest of the process."""
+    os.environ[ROOT_ENV_VAR] = str(Path(path).expanduser().resolve())
+    project_root.cache_clear()
+
+
+def raw_data_dir():
+    return project_root() / 'data' / 'raw'
+
+
+def results_dir():
+    return project_root() / 'analysis' / 'results'
+
+
+def raw_file(name):
+    """Path of an input file in data/raw/."""
+    return raw_data_dir() / name
+
+
+def result_file(name):
+    """Path of an output file in analysis/results/."""
+    return results_dir() / name
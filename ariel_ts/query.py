@@ -0,0 +1,329 @@
+"""
+Indexed in-memory target query engine.
+
+Selecting targets used to mean re-merging the MCMC summary, the regime
+probabilities, the catalogue ``Max Tier`` and the variability estimates in
+every notebook, then chaining ``nlargest`` / boolean filters. ``TargetTable``
+loads and joins those tables once into typed numpy columns keyed by planet,
+keeps a sorted index for each ranking column, and answers compound
+filter / top-k queries without touching pandas:
+
+    table = TargetTable.load()
+    result = table.query(tier=2, prob_true_eclipse=(0.8, None),
+                         variability_ppm=(None, 500),
+                         top=20, by='prob_true_eclipse')
+    result.to_tier_csv('my_selection.csv')
+
+Range filters are ``(low, high)`` tuples, inclusive, with None for an open
+end; any other value is an equality filter. Rows with NaN in a filtered
+column never match, and NaN sorts last in every ranking.
+"""
+
+import os
+
+import numpy as np
+
+from . import paths
+from .tiers import OUTPUT_COLUMNS as TIER_COLUMNS
+
+# Ranking columns that get a sorted index
+INDEXED_COLUMNS = (
+    'prob_true_eclipse', 'prob_grazing_eclipse', 'prob_false_eclipse',
+    'b_occ_median', 'Max Tier', 'variability_ppm', 'eclipse_depth_ppm', 'min_visits',
+)
+
+FLOAT_COLUMNS = (
+    'b_occ_median', 'b_occ_16', 'b_occ_84', 'b_occ_std', 'k_rp_rs',
+    't_eclipse_median', 't_eclipse_std',
+    'prob_false_eclipse', 'prob_grazing_eclipse', 'prob_true_eclipse',
+    'Max Tier', 'variability_ppm', 'eclipse_depth_ppm', 'min_visits',
+)
+BOOL_COLUMNS = ('eclipse_observed',)
+STRING_COLUMNS = ('dominant_regime', 'variability_source', 'eclipse_depth_source')
+
+# load() warns when fewer planets than this have an eclipse depth
+DEPTH_COVERAGE_WARNING = 0.9
+
+# Short names accepted by query() and the CLI
+ALIASES = {
+    'tier': 'Max Tier',
+    'variability': 'variability_ppm',
+    'depth': 'eclipse_depth_ppm',
+    'visits': 'min_visits',
+    'b_occ': 'b_occ_median',
+    'p_true': 'prob_true_eclipse',
+    'p_grazing': 'prob_grazing_eclipse',
+    'p_false': 'prob_false_eclipse',
+}
+
+
+def resolve_column(name):
+    return ALIASES.get(name, name)
+
+
+def _as_bool(values):
+    return np.array([str(v).strip().upper() == 'TRUE' for v in values], dtype=bool)
+
+
+class QueryResult:
+    """
+    Rows selected by a query, in result order.
+
+    Attributes:
+    -----------
+    table : TargetTable
+        Table the rows belong to
+    rows : ndarray of int
+        Row positions in ``table``
+    """
+
+    def __init__(self, table, rows):
+        self.table = table
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.planets)
+
+    @property
+    def planets(self):
+        return self.table.planets[self.rows].tolist()
+
+    def column(self, name):
+        return self.table.columns[resolve_column(name)][self.rows]
+
+    def to_frame(self, columns=None):
+        """Selected rows as a DataFrame (all columns by default)."""
+        import pandas as pd
+
+        columns = columns or ['Planet', *self.table.columns]
+        data = {col: (self.planets if col == 'Planet' else self.column(col)) for col in columns}
+        return pd.DataFrame(data, columns=columns)
+
+    def to_tier_csv(self, path):
+        """Write the selection in the tier<N>_eclipse_candidates.csv schema."""
+        frame = self.to_frame(TIER_COLUMNS)
+        frame['Max Tier'] = frame['Max Tier'].astype('Int64')
+        frame.to_csv(path, index=False)
+        return path
+
+
+class TargetTable:
+    """
+    Joined per-planet table with sorted indexes on the ranking columns.
+
+    Parameters:
+    -----------
+    planets : array of str
+        Planet names, one per row (unique)
+    columns : dict
+        Column name -> 1-D numpy array aligned with ``planets``
+    """
+
+    def __init__(self, planets, columns):
+        self.planets = np.asarray(planets, dtype=object)
+        self.columns = columns
+        self.row_of = {name: i for i, name in enumerate(self.planets)}
+        if len(self.row_of) != len(self.planets):
+            raise ValueError("Planet names must be unique")
+
+        # order[col]: row positions sorted ascending, NaN last
+        # sorted_values[col]: the column values in that order
+        self.order = {}
+        self.sorted_values = {}
+        for col in INDEXED_COLUMNS:
+            if col in columns:
+                order = np.argsort(columns[col], kind='stable')
+                self.order[col] = order
+                self.sorted_values[col] = columns[col][order]
+
+    def __len__(self):
+        return len(self.planets)
+
+    @classmethod
+    def from_frames(cls, mcmc_df, regime_df, catalogue_df, variability_df, depth_df=None,
+                    detectability_df=None):
+        """
+        Join the pipeline tables on planet name.
+
+        Parameters:
+        -----------
+        mcmc_df : DataFrame
+            MCMC summary (``Planet``, b_occ_*, k_rp_rs, ...); defines the rows
+        regime_df : DataFrame
+            Regime probabilities (``Planet``, prob_*, dominant_regime)
+        catalogue_df : DataFrame
+            Raw MCS catalogue (``Planet Name``, ``Max Tier``, ``Eclipse Depth [%]``)
+        variability_df : DataFrame
+            Variability estimates (``Planet Name``, variability_ppm, variability_source)
+        depth_df : DataFrame, optional
+            Eclipse depth Monte Carlo output (``Planet``, depth_ppm)
+        detectability_df : DataFrame, optional
+            Detectability output (``Planet``, min_visits, depth_ppm_median)
+
+        ``eclipse_depth_ppm`` takes the first available of: the depth Monte
+        Carlo, the modelled depth from the detectability run, the measured
+        catalogue eclipse depth. ``eclipse_depth_source`` records which
+        ('depth_mc', 'detectability', 'catalogue' or '' if none).
+        """
+        import pandas as pd
+
+        regime_cols = ['Planet', 'prob_false_eclipse', 'prob_grazing_eclipse',
+                       'prob_true_eclipse', 'dominant_regime']
+        merged = (
+            mcmc_df.drop_duplicates('Planet')
+            .merge(regime_df[regime_cols], on='Planet', how='left')
+            .merge(catalogue_df[['Planet Name', 'Max Tier', 'Eclipse Depth [%]']]
+                   .rename(columns={'Planet Name': 'Planet'}), on='Planet', how='left')
+            .merge(variability_df[['Planet Name', 'variability_ppm', 'variability_source']]
+                   .rename(columns={'Planet Name': 'Planet'}), on='Planet', how='left')
+        )
+
+        depth_sources = []
+        if depth_df is not None:
+            depth_sources.append(('depth_mc', depth_df, 'depth_ppm'))
+        if detectability_df is not None:
+            depth_sources.append(('detectability', detectability_df, 'depth_ppm_median'))
+
+        eclipse_depth_ppm = pd.Series(np.nan, index=merged.index)
+        eclipse_depth_source = pd.Series('', index=merged.index, dtype=object)
+        for source, df, col in depth_sources:
+            values = merged['Planet'].map(df.drop_duplicates('Planet').set_index('Planet')[col])
+            fill = eclipse_depth_ppm.isna() & values.notna()
+            eclipse_depth_ppm[fill] = values[fill]
+            eclipse_depth_source[fill] = source
+        catalogue_depth = merged['Eclipse Depth [%]'] * 1e4
+        fill = eclipse_depth_ppm.isna() & catalogue_depth.notna()
+        eclipse_depth_ppm[fill] = catalogue_depth[fill]
+        eclipse_depth_source[fill] = 'catalogue'
+        merged['eclipse_depth_ppm'] = eclipse_depth_ppm
+        merged['eclipse_depth_source'] = eclipse_depth_source
+
+        if detectability_df is not None:
+            min_visits = detectability_df.drop_duplicates('Planet').set_index('Planet')['min_visits']
+            merged['min_visits'] = merged['Planet'].map(min_visits).astype(float)
+
+        columns = {}
+        for col in FLOAT_COLUMNS:
+            if col in merged:
+                columns[col] = merged[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        for col in BOOL_COLUMNS:
+            columns[col] = _as_bool(merged[col])
+        for col in STRING_COLUMNS:
+            columns[col] = merged[col].astype(object).where(merged[col].notna(), '').to_numpy()
+
+        return cls(merged['Planet'].to_numpy(dtype=object), columns)
+
+    @classmethod
+    def load(cls, mcmc_csv=None, regime_csv=None, variability_csv=None, depth_csv=None,
+             detectability_csv=None):
+        """
+        Load and join the pipeline outputs from analysis/results/.
+
+        The eclipse depth and detectability tables are optional and used when
+        present; a warning is printed when most planets end up without an
+        eclipse depth (run ``ariel-ts detectability`` or ``ariel-ts depth``).
+        """
+        import pandas as pd
+
+        depth_csv = depth_csv or paths.result_file(paths.ECLIPSE_DEPTHS)
+        detectability_csv = detectability_csv or paths.result_file(paths.DETECTABILITY)
+        table = cls.from_frames(
+            pd.read_csv(mcmc_csv or paths.result_file(paths.MCS_MCMC_RESULTS)),
+            pd.read_csv(regime_csv or paths.result_file(paths.REGIME_PROBABILITIES)),
+            pd.read_csv(paths.raw_file(paths.MCS_KNOWN_CATALOG)),
+            pd.read_csv(variability_csv or paths.result_file(paths.STELLAR_VARIABILITY)),
+            pd.read_csv(depth_csv) if os.path.exists(depth_csv) else None,
+            pd.read_csv(detectability_csv) if os.path.exists(detectability_csv) else None,
+        )
+        coverage = np.mean(np.isfinite(table.columns['eclipse_depth_ppm'])) if len(table) else 1.0
+        if coverage < DEPTH_COVERAGE_WARNING:
+            print(f"⚠️  Eclipse depth available for only {coverage:.0%} of planets; "
+                  f"run 'ariel-ts detectability' to model depths for all MCS planets")
+        return table
+
+    def _mask(self, column, condition):
+        """Boolean row mask for one filter, using the sorted index when available."""
+        col = resolve_column(column)
+        if col not in self.columns:
+            raise KeyError(f"Unknown column: {column}")
+        values = self.columns[col]
+
+        if isinstance(condition, tuple):
+            low, high = condition
+            if col in self.order:
+                sorted_values = self.sorted_values[col]
+                start = 0 if low is None else np.searchsorted(sorted_values, low, side='left')
+                stop = (np.searchsorted(sorted_values, high, side='right') if high is not None
+                        else len(sorted_values) - np.count_nonzero(np.isnan(sorted_values)))
+                mask = np.zeros(len(self), dtype=bool)
+                mask[self.order[col][start:stop]] = True
+                return mask
+            # NaN never matches, as on the indexed path
+            mask = ~np.isnan(values) if values.dtype.kind == 'f' else np.ones(len(self), dtype=bool)
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+            return mask
+
+        if isinstance(condition, (list, set, frozenset)):
+            return np.isin(values, list(condition))
+        return values == condition
+
+    def _ranking_column(self, by):
+        """Resolve and check a ranking column: it must exist and be numeric."""
+        col = resolve_column(by)
+        if col not in self.columns:
+            raise KeyError(f"Unknown column: {by}")
+        if self.columns[col].dtype.kind != 'f':
+            raise ValueError(f"Cannot rank by non-numeric column: {by}")
+        return col
+
+    def query(self, top=None, by=None, ascending=False, **filters):
+        """
+        Filter rows and optionally rank them.
+
+        Parameters:
+        -----------
+        top : int, optional
+            Return at most this many rows
+        by : str, optional
+            Numeric ranking column (indexed columns avoid a sort per query)
+        ascending : bool
+            Rank smallest first (default: largest first)
+        **filters
+            column=value, column=(low, high) or column=[v1, v2, ...];
+            aliases such as tier= or variability= are accepted
+
+        Returns:
+        --------
+        result : QueryResult
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for column, condition in filters.items():
+            mask &= self._mask(column, condition)
+
+        if by is None:
+            rows = np.flatnonzero(mask)
+        else:
+            col = self._ranking_column(by)
+            order = self.order.get(col)
+            if order is None:
+                order = np.argsort(self.columns[col], kind='stable')
+            if not ascending:
+                # Largest first, NaN still last
+                n_valid = len(order) - np.count_nonzero(np.isnan(self.columns[col]))
+                order = np.concatenate([order[:n_valid][::-1], order[n_valid:]])
+            rows = order[mask[order]]
+
+        if top is not None:
+            rows = rows[:top]
+        return QueryResult(self, rows)
+
+    def get(self, planet):
+        """All column values for one planet as a dict."""
+        row = self.row_of[planet]
+        return {'Planet': planet, **{col: values[row] for col, values in self.columns.items()}}
@@ -0,0 +1,149 @@
+"""
+Occultation regime probabilities (true / grazing / false eclipse).
+
+Command-line port of ``analysis/notebooks/mcs_occultation_regime_analysis.ipynb``.
+For each planet, b is drawn from the MCMC b_occ posterior (100 stored
+quantiles) and k = Rp/Rs from a split normal on the catalogue value, then
+the samples are classified as
+
+- true eclipse:    b < 1 - k
+- grazing eclipse: 1 - k <= b <= 1 + k
+- false eclipse:   b > 1 + k
+"""
+
+import numpy as np
+import pandas as pd
+
+REGIME_COLUMNS = ['prob_false_eclipse', 'prob_grazing_eclipse', 'prob_true_eclipse']
+
+OUTPUT_COLUMNS = [
+    'Planet', 'eclipse_observed', 'b_occ_median', 'k_nominal',
+    'prob_false_eclipse', 'prob_grazing_eclipse', 'prob_true_eclipse',
+    'b_mean', 'b_std', 'k_mean', 'k_std', 'dominant_regime'
+]
+
+SUMMARY_COLUMNS = [
+    'Planet', 'eclipse_observed', 'b_occ_median', 'k_nominal',
+    'prob_false_eclipse', 'prob_grazing_eclipse', 'prob_true_eclipse',
+    'dominant_regime'
+]
+
+# P(grazing) above which a planet is listed as a grazing candidate
+GRAZING_CANDIDATE_THRESHOLD = 0.30
+
+
+def parse_quantiles(value):
+    """Parse a comma-separated quantile string from the MCMC CSV."""
+    return np.array([float(x) for x in value.split(',')])
+
+
+def calculate_regime_probabilities(row, n_samples=100000):
+    """
+    Calculate probabilities for each occultation regime using Monte Carlo sampling.
+
+    Parameters:
+    -----------
+    row : pandas.Series
+        Merged MCMC + catalogue row (b_occ_* columns and Rp/Rs with errors)
+    n_samples : int
+        Number of Monte Carlo samples to draw
+
+    Returns:
+    --------
+    dict : Probabilities for each regime and sample moments of b and k
+    """
+    k_nominal = row['Rp/Rs']
+    k_err_lower = abs(row['Rp/Rs Error Lower'])
+    k_err_upper = abs(row['Rp/Rs Error Upper'])
+
+    if pd.isna(k_nominal):
+        # Fall back to the MCMC k with an assumed 1% uncertainty
+        k_nominal = row['k_rp_rs']
+        k_err_lower = k_err_upper = 0.01 * k_nominal
+
+    # Asymmetric normal: pick a side, then draw with that side's width
+    below = np.random.rand(n_samples) < 0.5
+    k_samples = np.random.normal(k_nominal, np.where(below, k_err_lower, k_err_upper))
+    k_samples = np.clip(k_samples, 0.001, 1.0)
+
+    if pd.notna(row.get('b_occ_quantiles', np.nan)):
+        # Inverse-CDF sampling from the stored empirical quantiles
+        quantiles = parse_quantiles(row['b_occ_quantiles'])
+        random_percentiles = np.random.uniform(0, 100, n_samples)
+        percentile_grid = np.linspace(0, 100, len(quantiles))
+        b_samples = np.interp(random_percentiles, percentile_grid, quantiles)
+    else:
+        # Gaussian approximation with std = (84th - 16th) / 2
+        b_std = (row['b_occ_84'] - row['b_occ_16']) / 2.0
+        b_samples = np.abs(np.random.normal(row['b_occ_median'], b_std, n_samples))
+
+    true_eclipse = b_samples < (1 - k_samples)
+    grazing_eclipse = (b_samples >= (1 - k_samples)) & (b_samples <= (1 + k_samples))
+    false_eclipse = b_samples > (1 + k_samples)
+
+    return {
+        'prob_false_eclipse': np.mean(false_eclipse),
+        'prob_grazing_eclipse': np.mean(grazing_eclipse),
+        'prob_true_eclipse': np.mean(true_eclipse),
+        'k_mean': np.mean(k_samples),
+        'k_std': np.std(k_samples),
+        'b_mean': np.mean(b_samples),
+        'b_std': np.std(b_samples)
+    }
+
+
+def dominant_regime(results_df):
+    """Label each row with its highest-probability regime, e.g. 'True Eclipse'."""
+    return (results_df[REGIME_COLUMNS].idxmax(axis=1)
+            .str.replace('prob_', '')
+            .str.replace('_', ' ')
+            .str.title())
+
+
+def compute_regimes(mcmc_df, catalogue_df, n_samples=100000, seed=42):
+    """
+    Compute regime probabilities for every planet in the MCMC results.
+
+    Parameters:
+    -----------
+    mcmc_df : DataFrame
+        MCMC summary table (Planet, b_occ_*, k_rp_rs, eclipse_observed)
+    catalogue_df : DataFrame
+        Raw MCS catalogue with Rp/Rs and its errors
+    n_samples : int
+        Monte Carlo samples per planet
+    seed : int
+        Random seed for reproducibility
+
+    Returns:
+    --------
+    results_df : DataFrame
+        One row per planet with OUTPUT_COLUMNS
+    """
+    np.random.seed(seed)
+
+    merged_df = mcmc_df.merge(
+        catalogue_df[['Planet Name', 'Rp/Rs', 'Rp/Rs Error Lower', 'Rp/Rs Error Upper']],
+        left_on='Planet',
+        right_on='Planet Name',
+        how='left'
+    )
+
+    regime_results = []
+    for _, row in merged_df.iterrows():
+        result = calculate_regime_probabilities(row, n_samples=n_samples)
+        result['Planet'] = row['Planet']
+        result['eclipse_observed'] = row['eclipse_observed']
+        result['b_occ_median'] = row['b_occ_median']
+        result['k_nominal'] = row['Rp/Rs'] if pd.notna(row['Rp/Rs']) else row['k_rp_rs']
+        regime_results.append(result)
+
+    results_df = pd.DataFrame(regime_results)
+    results_df['dominant_regime'] = dominant_regime(results_df)
+    return results_df[OUTPUT_COLUMNS]
+
+
+def grazing_candidates(results_df, threshold=GRAZING_CANDIDATE_THRESHOLD):
+    """Planets with P(grazing) above threshold, most grazing first."""
+    selected = results_df[results_df['prob_grazing_eclipse'] > threshold]
+    return selected.sort_values('prob_grazing_eclipse', ascending=False)
@@ -0,0 +1,248 @@
+"""
+Scaling harness for the pipeline stages.
+
+Runs the MCMC driver, the regime engine, the eclipse depth Monte Carlo and
+the variability stage on synthetic catalogues (``ariel_ts.synthetic``) of
+increasing size and records, per stage and size:
+
+- wall-clock seconds and throughput (systems / s), best of ``repeats``
+  untraced runs
+- peak traced memory (tracemalloc), from one separate traced run, since
+  tracing slows pure-Python stages several-fold
+
+From consecutive sizes it fits the local scaling exponent
+``log(t2 / t1) / log(n2 / n1)`` (1 for linear scaling) and reports the first
+size at which a stage stops scaling linearly.
+
+The regime and depth stages take a synthetic MCMC summary table as input, so
+they can be scaled to 100k systems without paying for emcee. The MCMC stage
+runs the real resumable driver (``mcmc.run_catalogue``) with short chains
+(~0.25 s per system), so by default it only runs at DEFAULT_MCMC_SIZES; pass
+``mcmc_sizes`` to go further.
+"""
+
+import importlib
+import math
+import os
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+import numpy as np
+import pandas as pd
+
+from . import paths, synthetic
+
+STAGES = ('mcmc', 'regimes', 'depth', 'variability')
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_MCMC_SIZES = (100, 1000)
+DEFAULT_REPEATS = 3
+
+# Local exponent above 1 + tolerance counts as super-linear
+LINEAR_TOLERANCE = 0.15
+
+OUTPUT_COLUMNS = [
+    'stage', 'n_systems', 'seconds', 'systems_per_s', 'peak_memory_mb',
+    'memory_per_system_kb', 'time_exponent', 'memory_exponent', 'linear'
+]
+
+
+def _run_mcmc(catalog, summary, nwalkers=16, nsteps=200, burn_in=50, checkpoint_every=50, **_):
+    from . import mcmc
+
+    systems = mcmc.prepare_system_data(catalog, is_mcs=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            mcmc.run_catalogue(
+                systems, os.path.join(tmp, 'mcmc.csv'), os.path.join(tmp, 'chains.npz'),
+                nwalkers=nwalkers, nsteps=nsteps, burn_in=burn_in,
+                checkpoint_every=checkpoint_every
+            )
+
+
+def _run_regimes(catalog, summary, regime_samples=10000, **_):
+    from . import regimes
+
+    regimes.compute_regimes(summary, catalog, n_samples=regime_samples)
+
+
+def _run_depth(catalog, summary, depth_samples=10000, **_):
+    from . import depth
+
+    stellar = depth.extract_stellar_params(catalog, is_mcs=True)
+    systems = depth.merge_systems(summary, stellar, datasets=('MCS',))
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        depth.compute_depths(systems, n_samples=depth_samples)
+
+
+def _run_variability(catalog, summary, **_):
+    from . import variability
+
+    variability.estimate_variability(catalog)
+
+
+STAGE_RUNNERS = {
+    'mcmc': _run_mcmc,
+    'regimes': _run_regimes,
+    'depth': _run_depth,
+    'variability': _run_variability,
+}
+
+
+def measure_stage(stage, catalog, summary, trace_memory=True, repeats=DEFAULT_REPEATS, seed=42, **options):
+    """
+    Run one stage and measure it.
+
+    The timed runs are untraced; peak memory comes from one extra traced run.
+
+    Returns:
+    --------
+    seconds : float
+        Best wall-clock time of ``repeats`` untraced runs
+    peak_bytes : int or None
+        Peak traced allocation of the traced run (None if not traced)
+    """
+    runner = STAGE_RUNNERS[stage]
+    # Import outside the measured region so module loading is not counted
+    importlib.import_module(f'.{stage}', __package__)
+
+    seconds = []
+    for _ in range(max(1, repeats)):
+        # Stages draw from the global numpy RNG; reseed so every repeat does the same work
+        np.random.seed(seed)
+        start = time.perf_counter()
+        runner(catalog, summary, **options)
+        seconds.append(time.perf_counter() - start)
+
+    peak_bytes = None
+    if trace_memory:
+        np.random.seed(seed)
+        tracemalloc.start()
+        try:
+            runner(catalog, summary, **options)
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return min(seconds), peak_bytes
+
+
+def _exponent(n1, n2, v1, v2):
+    if not v1 or not v2 or v1 <= 0 or v2 <= 0:
+        return float('nan')
+    return math.log(v2 / v1) / math.log(n2 / n1)
+
+
+def run_scaling(sizes=DEFAULT_SIZES, stages=STAGES, mcmc_sizes=DEFAULT_MCMC_SIZES, seed=42,
+                trace_memory=True, repeats=DEFAULT_REPEATS, tolerance=LINEAR_TOLERANCE,
+                verbose=True, **options):
+    """
+    Measure every stage at every catalogue size.
+
+    Parameters:
+    -----------
+    sizes : sequence of int
+        Synthetic catalogue sizes (number of planets)
+    stages : sequence of str
+        Subset of STAGES to run
+    mcmc_sizes : sequence of int
+        Sizes for the MCMC stage (the real emcee driver, ~0.25 s per system)
+    seed : int
+        Seed for the synthetic catalogues and the stages' numpy RNG
+    trace_memory : bool
+        Measure peak memory in an extra tracemalloc run (not timed)
+    repeats : int
+        Untraced timed runs per point; the fastest is kept
+    tolerance : float
+        Allowed excess of the local time exponent over 1
+    **options
+        Stage options: nwalkers, nsteps, burn_in, checkpoint_every,
+        regime_samples, depth_samples
+
+    Returns:
+    --------
+    results_df : DataFrame
+        One row per (stage, size) with OUTPUT_COLUMNS
+    """
+    template = pd.read_csv(paths.raw_file(synthetic.CATALOG_FILES['mcs']))
+
+    rows = []
+    for n in sorted(set(sizes) | (set(mcmc_sizes) if 'mcmc' in stages else set())):
+        catalog = synthetic.generate_catalog(n, kind='mcs', template=template, seed=seed)
+        summary = synthetic.synthetic_mcmc_summary(catalog, seed=seed)
+        for stage in stages:
+            if n not in (mcmc_sizes if stage == 'mcmc' else sizes):
+                continue
+            seconds, peak_bytes = measure_stage(stage, catalog, summary,
+                                                trace_memory=trace_memory, repeats=repeats,
+                                                seed=seed, **options)
+            peak_mb = peak_bytes / 1e6 if peak_bytes is not None else float('nan')
+            rows.append({
+                'stage': stage,
+                'n_systems': n,
+                'seconds': seconds,
+                'systems_per_s': n / seconds if seconds > 0 else float('nan'),
+                'peak_memory_mb': peak_mb,
+                'memory_per_system_kb': peak_mb * 1e3 / n,
+            })
+            if verbose:
+                print(f"  {stage:<12} n={n:>7}  {seconds:9.2f} s  "
+                      f"{n / seconds:10.1f} sys/s  peak {peak_mb:9.1f} MB")
+
+    results_df = pd.DataFrame(rows, columns=OUTPUT_COLUMNS[:6])
+    return add_exponents(results_df, tolerance=tolerance)
+
+
+def add_exponents(results_df, tolerance=LINEAR_TOLERANCE):
+    """Add local time / memory exponents versus the previous size of each stage."""
+    results_df = results_df.sort_values(['stage', 'n_systems']).reset_index(drop=True)
+    results_df['time_exponent'] = float('nan')
+    results_df['memory_exponent'] = float('nan')
+    for _, group in results_df.groupby('stage'):
+        index = group.index
+        for prev, cur in zip(index[:-1], index[1:]):
+            n1, n2 = results_df.at[prev, 'n_systems'], results_df.at[cur, 'n_systems']
+            results_df.at[cur, 'time_exponent'] = _exponent(
+                n1, n2, results_df.at[prev, 'seconds'], results_df.at[cur, 'seconds'])
+            results_df.at[cur, 'memory_exponent'] = _exponent(
+                n1, n2, results_df.at[prev, 'peak_memory_mb'], results_df.at[cur, 'peak_memory_mb'])
+    results_df['linear'] = ~(results_df['time_exponent'] > 1 + tolerance)
+    return results_df[OUTPUT_COLUMNS]
+
+
+def scaling_breaks(results_df):
+    """
+    First size at which each stage stops scaling linearly.
+
+    Returns:
+    --------
+    breaks : dict
+        stage -> n_systems of the first super-linear step, or None
+    """
+    breaks = {}
+    for stage, group in results_df.groupby('stage', sort=False):
+        nonlinear = group[~group['linear']]
+        breaks[stage] = int(nonlinear['n_systems'].iloc[0]) if len(nonlinear) else None
+    return breaks
+
+
+def scaling_report(results_df):
+    """Plain-text report of throughput, memory and scaling breaks."""
+    lines = [
+        f"{'stage':<12} {'n':>8} {'seconds':>10} {'sys/s':>10} {'peak MB':>9} "
+        f"{'kB/sys':>8} {'t-exp':>6} {'m-exp':>6}"
+    ]
+    for _, row in results_df.iterrows():
+        lines.append(
+            f"{row['stage']:<12} {row['n_systems']:>8} {row['seconds']:>10.2f} "
+            f"{row['systems_per_s']:>10.1f} {row['peak_memory_mb']:>9.1f} "
+            f"{row['memory_per_system_kb']:>8.2f} {row['time_exponent']:>6.2f} "
+            f"{row['memory_exponent']:>6.2f}"
+        )
+    lines.append('')
+    for stage, n in scaling_breaks(results_df).items():
+        if n is None:
+            lines.append(f"✓ {stage}: linear over the measured range")
+        else:
+            lines.append(f"⚠️  {stage}: stops scaling linearly at {n} systems")
+    return '\n'.join(lines)
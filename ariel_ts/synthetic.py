@@ -0,0 +1,171 @@
+"""
+Synthetic Ariel catalogues for scaling tests.
+
+Rows are bootstrapped from the real ``Ariel_MCS_Known`` / ``Ariel_MCS_TPCs``
+files, so the joint parameter distributions, missing-value patterns and
+error-bar distributions are those of the shipped catalogues. Each drawn row
+is then jittered consistently so the output is not just repeated planets:
+
+- stellar radius, semi-major axis and planet radius get independent
+  log-normal factors, and a/Rs, Rp/Rs and the period (Kepler's third law at
+  fixed stellar mass) follow from them
+- the transit impact parameter is kept and the inclination recomputed from
+  it, which preserves the transiting geometry
+- error columns are scaled by the same factor as their value column
+
+Names and TIC IDs are replaced with unique synthetic identifiers. The
+output has exactly the input column layout and can be fed to every
+pipeline stage.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import paths
+
+CATALOG_FILES = {
+    'mcs': paths.MCS_KNOWN_CATALOG,
+    'tpc': paths.MCS_TPC_CATALOG,
+}
+
+# Log-normal jitter widths (fractional)
+STAR_RADIUS_JITTER = 0.05
+SEMI_MAJOR_AXIS_JITTER = 0.05
+PLANET_RADIUS_JITTER = 0.05
+STAR_TEMPERATURE_JITTER = 0.02
+
+# Base for synthetic TIC numbers, above the range of real TIC IDs
+SYNTHETIC_TIC_BASE = 9_000_000_000
+
+
+def error_columns(df, column):
+    """Existing 'Error Lower' / 'Error Upper' columns belonging to ``column``."""
+    if ' [' in column:
+        stem, unit = column.split(' [', 1)
+        candidates = [f"{stem} Error {side} [{unit}" for side in ('Lower', 'Upper')]
+    else:
+        candidates = [f"{column} Error {side}" for side in ('Lower', 'Upper')]
+    return [c for c in candidates if c in df.columns]
+
+
+def _scale(df, column, factor):
+    if column not in df.columns:
+        return
+    for col in [column, *error_columns(df, column)]:
+        df[col] = pd.to_numeric(df[col], errors='coerce') * factor
+
+
+def generate_catalog(n_systems, kind='mcs', template=None, seed=None):
+    """
+    Generate a synthetic catalogue with the column layout of a real one.
+
+    Parameters:
+    -----------
+    n_systems : int
+        Number of planets to generate
+    kind : str
+        'mcs' (Ariel_MCS_Known layout) or 'tpc' (Ariel_MCS_TPCs layout)
+    template : DataFrame, optional
+        Catalogue to bootstrap from (default: the shipped 2025-07-18 file)
+    seed : int, optional
+        Random seed
+
+    Returns:
+    --------
+    catalog : DataFrame
+        ``n_systems`` rows, same columns and order as the template
+    """
+    if template is None:
+        template = pd.read_csv(paths.raw_file(CATALOG_FILES[kind]))
+    rng = np.random.default_rng(seed)
+
+    rows = rng.integers(0, len(template), size=n_systems)
+    catalog = template.iloc[rows].reset_index(drop=True).copy()
+
+    f_star = rng.lognormal(0.0, STAR_RADIUS_JITTER, n_systems)
+    f_a = rng.lognormal(0.0, SEMI_MAJOR_AXIS_JITTER, n_systems)
+    f_planet = rng.lognormal(0.0, PLANET_RADIUS_JITTER, n_systems)
+    f_teff = rng.lognormal(0.0, STAR_TEMPERATURE_JITTER, n_systems)
+
+    _scale(catalog, 'Star Radius [Rs]', f_star)
+    _scale(catalog, 'Star Temperature [K]', f_teff)
+    _scale(catalog, 'Planet Semi-major Axis [au]', f_a)
+    _scale(catalog, 'Planet Semi-major Axis [m]', f_a)
+    _scale(catalog, 'a/Rs', f_a / f_star)
+    _scale(catalog, 'Planet Period [days]', f_a ** 1.5)
+    _scale(catalog, 'Planet Radius [Rjup]', f_planet)
+    _scale(catalog, 'Planet Radius [Re]', f_planet)
+    _scale(catalog, 'Rp/Rs', f_planet / f_star)
+
+    # Keep b_tra, recompute i for the new a/Rs
+    if {'Impact Parameter', 'a/Rs', 'Inclination'} <= set(catalog.columns):
+        b_tra = pd.to_numeric(catalog['Impact Parameter'], errors='coerce')
+        a_over_rs = catalog['a/Rs']
+        has_b = b_tra.notna() & a_over_rs.notna() & (a_over_rs > 0)
+        cos_i = np.clip(b_tra[has_b] / a_over_rs[has_b], 0.0, 1.0)
+        catalog.loc[has_b, 'Inclination'] = np.degrees(np.arccos(cos_i))
+
+    ids = np.arange(n_systems)
+    catalog['Planet Name'] = [f"SYN-{i:06d} b" for i in ids]
+    catalog['Star Name'] = [f"SYN-{i:06d}" for i in ids]
+    if 'TIC ID' in catalog.columns:
+        catalog['TIC ID'] = [f"TIC {SYNTHETIC_TIC_BASE + i}" for i in ids]
+    if 'TIC' in catalog.columns:
+        catalog['TIC'] = SYNTHETIC_TIC_BASE + ids
+
+    return catalog[template.columns]
+
+
+def synthetic_mcmc_summary(catalog, n_draws=1000, chunk_size=10000, seed=None):
+    """
+    Cheap stand-in for the MCMC summary table of a synthetic catalogue.
+
+    b_occ is propagated by plain Monte Carlo from the catalogue a/Rs and
+    inclination (circular orbit) instead of running emcee, so that the
+    downstream stages (regimes, tiers, depth) can be scaled independently of
+    the MCMC cost.
+
+    Returns:
+    --------
+    summary : DataFrame
+        Planet, Dataset, eclipse_observed, b_occ_median/16/84/std,
+        b_occ_quantiles, k_rp_rs columns as in the MCMC CSVs
+    """
+    rng = np.random.default_rng(seed)
+    is_mcs = 'Eclipse Flag' in catalog.columns
+    n = len(catalog)
+
+    a_over_rs = pd.to_numeric(catalog['a/Rs'], errors='coerce').to_numpy(dtype=float)
+    inclination = pd.to_numeric(catalog['Inclination'], errors='coerce').to_numpy(dtype=float)
+    k = pd.to_numeric(catalog['Rp/Rs'], errors='coerce').fillna(0.1).to_numpy(dtype=float)
+    keep = np.isfinite(a_over_rs) & np.isfinite(inclination)
+
+    # Same 100-point grid as the MCMC CSVs, plus the 16/50/84 summary points
+    quantile_grid = np.linspace(0, 100, 100)
+    quantiles = np.full((n, len(quantile_grid)), np.nan)
+    summary_points = np.full((n, 3), np.nan)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        a = a_over_rs[start:stop, None] * rng.lognormal(0.0, 0.05, (stop - start, n_draws))
+        inc = inclination[start:stop, None] + rng.normal(0.0, 0.5, (stop - start, n_draws))
+        b_occ = a * np.clip(np.cos(np.radians(inc)), 0.0, 1.0)
+        quantiles[start:stop] = np.percentile(b_occ, quantile_grid, axis=1).T
+        summary_points[start:stop] = np.percentile(b_occ, [16, 50, 84], axis=1).T
+
+    b_16, b_50, b_84 = summary_points.T
+    if is_mcs:
+        eclipse_observed = (catalog['Eclipse Flag'].astype(str).str.upper() == 'TRUE').to_numpy()
+    else:
+        eclipse_observed = False
+    summary = pd.DataFrame({
+        'Planet': catalog['Planet Name'].to_numpy(),
+        'Dataset': 'MCS' if is_mcs else 'TPC',
+        'eclipse_observed': eclipse_observed,
+        'b_occ_median': b_50,
+        'b_occ_16': b_16,
+        'b_occ_84': b_84,
+        'b_occ_std': (b_84 - b_16) / 2,
+        'b_occ_quantiles': [','.join(f"{q:.6f}" for q in row) for row in quantiles],
+        'k_rp_rs': k,
+    })
+    return summary[keep].reset_index(drop=True)
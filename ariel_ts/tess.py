@@ -0,0 +1,81 @@
+"""
+TESS variability coverage of the MCS catalogue, broken down by Max Tier.
+
+Package version of ``analysis/scripts/check_tier_tess_coverage.py``. This
+is the quick query of the command-line tool, so it reads both CSV files with
+the standard library only instead of paying the pandas import cost.
+"""
+
+import csv
+
+
+def _tic_number(value):
+    value = value.strip()
+    if value.upper().startswith('TIC'):
+        value = value[3:].strip()
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def _tier(value):
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def load_tess_ids(tess_csv):
+    """Set of TIC numbers present in the TESS variability catalogue."""
+    with open(tess_csv, newline='') as handle:
+        ids = (_tic_number(row['tess_id']) for row in csv.DictReader(handle))
+        return {tic for tic in ids if tic is not None}
+
+
+def coverage_by_tier(catalogue_csv, tess_csv):
+    """
+    Flag each catalogue planet as covered by the TESS variability catalogue.
+
+    Returns:
+    --------
+    planets : list of dict
+        One entry per planet with 'Planet Name', 'TIC ID', 'Max Tier'
+        (int or None) and 'in_tess_var' (bool)
+    """
+    tess_ids = load_tess_ids(tess_csv)
+    planets = []
+    with open(catalogue_csv, newline='') as handle:
+        for row in csv.DictReader(handle):
+            planets.append({
+                'Planet Name': row['Planet Name'],
+                'TIC ID': row['TIC ID'],
+                'Max Tier': _tier(row['Max Tier']),
+                'in_tess_var': _tic_number(row['TIC ID']) in tess_ids,
+            })
+    return planets
+
+
+def coverage_report(planets, n_examples=15):
+    """Format the per-tier coverage summary as printed by the script."""
+    lines = ['=' * 70, 'TESS VARIABILITY COVERAGE BY MAX TIER', '=' * 70]
+
+    def summarise(label, subset):
+        count = len(subset)
+        with_tess = sum(p['in_tess_var'] for p in subset)
+        pct = 100 * with_tess / count if count > 0 else 0
+        lines.extend([f"\n{label}:", f"  Total planets: {count}",
+                      f"  With TESS variability: {with_tess} ({pct:.1f}%)"])
+
+    for tier in (1, 2, 3):
+        summarise(f"Max Tier {tier}", [p for p in planets if p['Max Tier'] == tier])
+    tier23 = [p for p in planets if p['Max Tier'] in (2, 3)]
+    summarise('Max Tier 2 or 3 combined', tier23)
+
+    examples = [p for p in tier23 if p['in_tess_var']][:n_examples]
+    if examples:
+        lines.extend(['\n' + '=' * 70, 'Examples of Max Tier 2/3 planets WITH TESS variability:', '=' * 70])
+        for p in examples:
+            lines.append(f"  {p['Planet Name']:<24} Tier {p['Max Tier']}  {p['TIC ID']}")
+
+    return '\n'.join(lines)
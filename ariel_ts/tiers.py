@@ -0,0 +1,38 @@
+"""
+Tier 2 / Tier 3 eclipse candidate lists.
+
+Command-line port of ``analysis/notebooks/tier2_eclipse_candidates.ipynb``:
+joins the MCMC b_occ summary, the regime probabilities and the catalogue
+``Max Tier`` column, and writes one list per tier sorted by P(true eclipse).
+"""
+
+OUTPUT_COLUMNS = [
+    'Planet', 'eclipse_observed', 'b_occ_median', 'b_occ_16', 'b_occ_84',
+    'k_rp_rs', 'Max Tier',
+    'prob_false_eclipse', 'prob_grazing_eclipse', 'prob_true_eclipse', 'dominant_regime'
+]
+
+
+def merge_tier_inputs(mcmc_df, regime_df, catalogue_df):
+    """
+    Merge MCMC results, regime probabilities and catalogue tiers on planet name.
+    """
+    return mcmc_df.merge(
+        regime_df[['Planet', 'prob_false_eclipse', 'prob_grazing_eclipse',
+                   'prob_true_eclipse', 'dominant_regime']],
+        on='Planet',
+        how='left'
+    ).merge(
+        catalogue_df[['Planet Name', 'Max Tier']],
+        left_on='Planet',
+        right_on='Planet Name',
+        how='left'
+    )
+
+
+def tier_candidates(merged_df, tier):
+    """
+    Candidates whose Max Tier equals ``tier``, most likely true eclipse first.
+    """
+    selected = merged_df[merged_df['Max Tier'] == tier]
+    return selected[OUTPUT_COLUMNS].sort_values('prob_true_eclipse', ascending=False)
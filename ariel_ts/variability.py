@@ -0,0 +1,218 @@
+"""
+Stellar variability estimates for the MCS catalogue.
+
+Package version of ``analysis/scripts/estimate_stellar_variability.py``.
+Variability (ppm) is taken from, in order of preference:
+
+1. TESS measured amplitude (``amp_var_1``)
+2. rotation period -> variability relation, with the rotation period taken
+   from the catalogue, derived from vsini, or from gyrochronology
+3. typical values for the stellar type
+"""
+
+import numpy as np
+import pandas as pd
+
+RSUN_KM = 695700
+
+OUTPUT_COLUMNS = [
+    'Planet Name', 'TIC ID', 'Star Temperature [K]', 'Star Rotational Velocity [km/s]',
+    'Star Rotation Period [days]', 'P_rot_derived', 'rotation_source',
+    'variability_ppm', 'variability_source'
+]
+
+
+def tic_numeric(tic_ids):
+    """Convert 'TIC 123' strings to floats for matching against tess_id."""
+    return tic_ids.astype(str).str.replace('TIC ', '', regex=False).replace('nan', np.nan).astype(float)
+
+
+def rotation_from_vsini(vsini, radius, assume_sin_i=0.8):
+    """
+    Derive rotation period from vsini and stellar radius.
+
+    P = 2 pi R / (vsini * sin(i))
+
+    Parameters:
+    -----------
+    vsini : float
+        Projected rotational velocity (km/s)
+    radius : float
+        Stellar radius (R_sun)
+    assume_sin_i : float
+        Assumed sin(i), default 0.8 for random orientations
+
+    Returns:
+    --------
+    P_rot : float
+        Rotation period in days
+    """
+    if pd.isna(vsini) or pd.isna(radius) or vsini == 0:
+        return np.nan
+    return (2 * np.pi * radius * RSUN_KM) / (vsini * assume_sin_i * 86400)
+
+
+def rotation_from_age(age_gyr, Teff, mass=None):
+    """
+    Gyrochronology rotation period, Barnes (2007) with an approximate
+    Teff -> B-V conversion.
+
+    Returns:
+    --------
+    P_rot : float
+        Rotation period in days, NaN outside the calibrated range
+    """
+    if pd.isna(age_gyr) or pd.isna(Teff) or age_gyr <= 0:
+        return np.nan
+
+    if Teff > 7000:  # Too hot for gyro
+        return np.nan
+    elif Teff > 6000:  # F stars
+        BV = 0.3 + 0.00004 * (6500 - Teff)
+    elif Teff > 5000:  # G stars
+        BV = 0.5 + 0.0003 * (6000 - Teff)
+    elif Teff > 3800:  # K stars
+        BV = 0.8 + 0.0004 * (5000 - Teff)
+    else:  # M dwarfs - gyro less reliable
+        BV = 1.5 + 0.0002 * (4000 - Teff)
+
+    if BV < 0.5:  # Too blue for reliable gyro
+        return np.nan
+
+    P_rot = 0.7725 * (age_gyr * 1000) ** 0.519 * (BV - 0.4) ** 0.601
+
+    # Rotation periods should be 0.5-100 days
+    if P_rot < 0.5 or P_rot > 100:
+        return np.nan
+    return P_rot
+
+
+def variability_from_rotation(P_rot, Teff):
+    """
+    Variability (ppm) from rotation period, after McQuillan et al. (2014)
+    and Morris et al. (2020), scaled up for K/M dwarfs and down for F stars.
+    """
+    if pd.isna(P_rot):
+        return np.nan
+
+    base_var = 1500 * (P_rot / 10) ** (-0.5)
+
+    if not pd.isna(Teff):
+        if Teff < 4000:  # M dwarf
+            base_var *= 2.0
+        elif Teff < 5200:  # K dwarf
+            base_var *= 1.5
+        elif Teff > 6500:  # F star
+            base_var *= 0.7
+
+    return base_var
+
+
+def variability_from_type(Teff, logg=None):
+    """
+    Typical variability (ppm) by stellar type; evolved stars (log g < 4) are
+    more variable.
+    """
+    if pd.isna(Teff):
+        return 500  # conservative default
+
+    is_evolved = not pd.isna(logg) and logg < 4.0
+
+    if Teff < 3500:  # M dwarf
+        return 3000 if not is_evolved else 5000
+    elif Teff < 4000:
+        return 2000 if not is_evolved else 3500
+    elif Teff < 5200:  # K dwarf
+        return 1000 if not is_evolved else 2000
+    elif Teff < 6000:  # G dwarf
+        return 200 if not is_evolved else 500
+    elif Teff < 7500:  # F star
+        return 300 if not is_evolved else 800
+    else:  # A star and hotter
+        return 100 if not is_evolved else 300
+
+
+def estimate_variability(mcs, tess=None):
+    """
+    Estimate stellar variability for every planet in the MCS catalogue.
+
+    Parameters:
+    -----------
+    mcs : DataFrame
+        Raw MCS catalogue
+    tess : DataFrame or None
+        TESS stellar variability catalogue (tess_id, amp_var_1). When None,
+        every star falls through to the rotation / stellar-type estimates.
+
+    Returns:
+    --------
+    mcs_with_var : DataFrame
+        Catalogue with P_rot_derived, rotation_source, variability_ppm and
+        variability_source columns added
+    """
+    mcs = mcs.copy()
+    mcs['TIC_numeric'] = tic_numeric(mcs['TIC ID'])
+
+    if tess is None:
+        mcs_with_var = mcs.assign(tess_id=np.nan, amp_var_1=np.nan)
+    else:
+        mcs_with_var = mcs.merge(
+            tess[['tess_id', 'amp_var_1']],
+            left_on='TIC_numeric',
+            right_on='tess_id',
+            how='left'
+        )
+
+    # Rotation period: catalogue, then vsini, then gyrochronology
+    mcs_with_var['P_rot_derived'] = mcs_with_var['Star Rotation Period [days]']
+
+    vsini_mask = mcs_with_var['P_rot_derived'].isna() & mcs_with_var['Star Rotational Velocity [km/s]'].notna()
+    if vsini_mask.any():
+        mcs_with_var.loc[vsini_mask, 'P_rot_derived'] = mcs_with_var.loc[vsini_mask].apply(
+            lambda row: rotation_from_vsini(row['Star Rotational Velocity [km/s]'], row['Star Radius [Rs]']),
+            axis=1
+        )
+
+    gyro_mask = mcs_with_var['P_rot_derived'].isna() & mcs_with_var['Star Age [Gyr]'].notna()
+    if gyro_mask.any():
+        mcs_with_var.loc[gyro_mask, 'P_rot_derived'] = mcs_with_var.loc[gyro_mask].apply(
+            lambda row: rotation_from_age(row['Star Age [Gyr]'], row['Star Temperature [K]'], row['Star Mass [Ms]']),
+            axis=1
+        )
+
+    mcs_with_var['variability_ppm'] = np.nan
+    mcs_with_var['variability_source'] = 'none'
+    mcs_with_var['rotation_source'] = 'none'
+
+    # 1. TESS measured
+    tess_mask = mcs_with_var['amp_var_1'].notna()
+    mcs_with_var.loc[tess_mask, 'variability_ppm'] = mcs_with_var.loc[tess_mask, 'amp_var_1']
+    mcs_with_var.loc[tess_mask, 'variability_source'] = 'TESS_measured'
+    mcs_with_var.loc[tess_mask, 'rotation_source'] = 'not_needed'
+
+    # 2. Rotation period (catalogue or derived)
+    has_rotation = mcs_with_var['P_rot_derived'].notna()
+    rotation_mask = ~tess_mask & has_rotation
+    if rotation_mask.any():
+        mcs_with_var.loc[rotation_mask, 'variability_ppm'] = mcs_with_var.loc[rotation_mask].apply(
+            lambda row: variability_from_rotation(row['P_rot_derived'], row['Star Temperature [K]']),
+            axis=1
+        )
+    mcs_with_var.loc[rotation_mask, 'variability_source'] = 'rotation_period'
+
+    catalog_prot = mcs_with_var['Star Rotation Period [days]'].notna()
+    mcs_with_var.loc[rotation_mask & catalog_prot, 'rotation_source'] = 'catalog'
+    mcs_with_var.loc[rotation_mask & ~catalog_prot & vsini_mask, 'rotation_source'] = 'vsini_derived'
+    mcs_with_var.loc[rotation_mask & ~catalog_prot & gyro_mask, 'rotation_source'] = 'gyro_derived'
+
+    # 3. Stellar type typical values for the rest
+    remaining_mask = ~tess_mask & ~has_rotation
+    if remaining_mask.any():
+        mcs_with_var.loc[remaining_mask, 'variability_ppm'] = mcs_with_var.loc[remaining_mask].apply(
+            lambda row: variability_from_type(row['Star Temperature [K]'], row['Star log(g)']),
+            axis=1
+        )
+    mcs_with_var.loc[remaining_mask, 'variability_source'] = 'stellar_type'
+    mcs_with_var.loc[remaining_mask, 'rotation_source'] = 'not_derived'
+
+    return mcs_with_var
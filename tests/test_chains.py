@@ -0,0 +1,114 @@
+import logging
+import math
+
+import numpy as np
+import pytest
+
+from ariel_ts import chains
+
+NWALKERS = 8
+NSTEPS = 3000
+RHO = 0.9
+EPOCH = 2459000.0
+
+
+def _ar1(rng, shape, rho=RHO):
+    """AR(1) series along axis 0, unit stationary variance."""
+    z = rng.standard_normal(shape)
+    x = np.empty(shape)
+    x[0] = z[0]
+    for t in range(1, shape[0]):
+        x[t] = rho * x[t - 1] + math.sqrt(1 - rho ** 2) * z[t]
+    return x
+
+
+def _entry(seed, nwalkers=NWALKERS, with_nwalkers=True):
+    """Flat step-major chain, as get_chain(flat=True) returns it."""
+    rng = np.random.RandomState(seed)
+    x = _ar1(rng, (NSTEPS, nwalkers, 4))
+    params = np.stack([8 + 0.3 * x[..., 0], 0.05 + 0.01 * x[..., 1],
+                       0.1 + 0.02 * np.abs(x[..., 2]), 90 + 20 * x[..., 3]], axis=-1)
+    samples = params.reshape(-1, 4)
+    b_occ = samples[:, 0] * samples[:, 1]
+    entry = {
+        'samples': samples,
+        'b_occ_samples': b_occ,
+        't_eclipse_samples': EPOCH + 0.4567 + 1e-3 * x[..., 0].ravel(),
+    }
+    if with_nwalkers:
+        entry['nwalkers'] = nwalkers
+    return entry
+
+
+@pytest.fixture(scope='module')
+def full_chains():
+    return {'A b': _entry(1), 'B c': _entry(2, nwalkers=16)}
+
+
+def test_autocorrelation_time_of_ar1():
+    # Integrated time of AR(1) is (1 + rho) / (1 - rho) = 19 steps
+    entry = _entry(3)
+    tau = chains.autocorrelation_time(entry)
+    assert tau == pytest.approx((1 + RHO) / (1 - RHO), rel=0.3)
+    assert chains.autocorrelation_time(entry, nwalkers=NWALKERS) == tau
+    # Reshaping with the wrong walker count mixes walkers and underestimates tau
+    assert chains.autocorrelation_time(entry, nwalkers=4 * NWALKERS) < 0.5 * tau
+    with pytest.raises(ValueError):
+        chains.autocorrelation_time(_entry(3), nwalkers=7)
+
+
+def test_autocorrelation_time_leaves_logging_alone():
+    logger = logging.getLogger('emcee.autocorr')
+    level = logger.level
+    chains.autocorrelation_time(_entry(5))
+    assert logger.level == level
+    assert logging.root.manager.disable == logging.NOTSET
+
+
+def test_thin_indices_keep_every_walker_of_every_thin_step():
+    steps = np.arange(10)[:, None] * 100 + np.arange(4)[None, :]
+    flat = steps.ravel()
+    assert np.array_equal(flat[chains.thin_indices(len(flat), 4, 3)], steps[::3].ravel())
+
+
+def test_compact_round_trip(full_chains, tmp_path):
+    path = tmp_path / 'compact.npz'
+    report = chains.export_compact(full_chains, {'A b': EPOCH}, path)
+    loaded = chains.load_chains(path)
+    assert list(loaded) == list(full_chains)
+
+    thin = report.groupby('Planet')['thin'].first()
+    for name, full in full_chains.items():
+        assert thin[name] > 1
+        indices = chains.thin_indices(len(full['samples']), full['nwalkers'], thin[name])
+        compact = loaded[name]
+        assert compact['samples'].dtype == np.float32
+        np.testing.assert_allclose(compact['samples'], full['samples'][indices], rtol=1e-6)
+        np.testing.assert_allclose(compact['b_occ_samples'], full['b_occ_samples'][indices], rtol=1e-6)
+        # float64 offsets from the epoch keep absolute times to well below a millisecond
+        np.testing.assert_allclose(compact['t_eclipse_samples'], full['t_eclipse_samples'][indices],
+                                   rtol=0, atol=1e-8)
+
+    assert report['within_tolerance'].all()
+    assert len(report) == len(full_chains) * len(chains.QUANTITIES)
+
+
+def test_thinning_is_halved_until_within_tolerance(full_chains, tmp_path):
+    entry = {'A b': full_chains['A b']}
+    tau = chains.autocorrelation_time(entry['A b'])
+    report = chains.export_compact(entry, {}, tmp_path / 'c.npz', thin_factor=50, tolerance=0.02)
+    assert report['within_tolerance'].all()
+    assert report['thin'].iloc[0] < math.ceil(50 * tau)
+
+
+def test_full_archive_without_nwalkers_loads(tmp_path):
+    full = {'A b': _entry(4, with_nwalkers=False)}
+    path = tmp_path / 'full.npz'
+    np.savez_compressed(path, **full)
+    loaded = chains.load_chains(path)
+    assert 'nwalkers' not in loaded['A b']
+    for key in ('samples', 'b_occ_samples', 't_eclipse_samples'):
+        np.testing.assert_array_equal(loaded['A b'][key], full['A b'][key])
+
+    report = chains.export_compact(loaded, {}, tmp_path / 'compact.npz', nwalkers=NWALKERS)
+    assert report['within_tolerance'].all()
@@ -0,0 +1,35 @@
+import pytest
+
+from ariel_ts import cli
+from ariel_ts.query import TargetTable
+
+
+def test_repeated_where_intersects_ranges():
+    filters = {}
+    cli._add_filter(filters, 'prob_true_eclipse', (0.3, None))
+    cli._add_filter(filters, 'prob_true_eclipse', (None, 0.5))
+    cli._add_filter(filters, 'prob_true_eclipse', (0.35, None))
+    assert filters == {'prob_true_eclipse': (0.35, 0.5)}
+
+
+def test_conflicting_filters_are_rejected():
+    filters = {'Max Tier': 1.0}
+    with pytest.raises(SystemExit):
+        cli._add_filter(filters, 'Max Tier', 2.0)
+    with pytest.raises(SystemExit):
+        cli._add_filter({'b_occ_median': (0.8, None)}, 'b_occ_median', (None, 0.5))
+    filters = {'Max Tier': [2, 3]}
+    cli._add_filter(filters, 'Max Tier', (3, None))
+    assert filters == {'Max Tier': 3}
+
+
+def test_select_with_two_bounds(capsys):
+    cli.main(['select', '--where', 'prob_true_eclipse>=0.3', '--where', 'prob_true_eclipse<=0.5',
+              '--ascending', '--top', '3'])
+    lines = capsys.readouterr().out.splitlines()
+    planets = [line.split()[0] for line in lines[1:4]]
+    table = TargetTable.load()
+    values = [table.get(planet)['prob_true_eclipse'] for planet in planets]
+    assert len(values) == 3
+    assert all(0.3 <= value <= 0.5 for value in values)
+    assert values == sorted(values)
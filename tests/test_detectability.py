@@ -0,0 +1,101 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ariel_ts import depth, detectability
+
+HOT_JUPITER = {'T_star': 6000.0, 'R_star': 1.0, 'R_p': 1.2, 'a': 0.03}
+ERRORS = {'T_star_err': 100.0, 'R_star_err': 0.05, 'R_p_err': 0.05, 'a_err': 0.001}
+
+
+def _targets(rows):
+    """Hand-built targets in the build_targets layout (Ks = 10, 2 hr eclipse by default)."""
+    defaults = {'Dataset': 'MCS', 'Max Tier': 2, 'ks_mag': 10.0, 'duration_hr': 2.0,
+                'variability_ppm': 0.0, 'variability_source': 'stellar_type',
+                **HOT_JUPITER, **{key: 0.0 for key in ERRORS}}
+    return pd.DataFrame([{'Planet': f'P{i}', **defaults, **row} for i, row in enumerate(rows)])
+
+
+def _noiseless_depth():
+    columns = [np.array([value]) for k in ('T_star', 'R_star', 'R_p', 'a') for value in (HOT_JUPITER[k], 0.0)]
+    return depth.sample_depths_ppm(*columns, n_samples=1)[0, 0]
+
+
+def test_min_visits_matches_analytic_threshold():
+    # Without parameter errors every depth sample is D, so S/N(N) >= 3 first at
+    # N = ceil(sigma_visit^2 / ((D/3)^2 - sigma_floor^2))
+    D = _noiseless_depth()
+    floor = D / 6
+    visit_noise = math.sqrt(12.5 * ((D / 3) ** 2 - floor ** 2))
+    targets = _targets([{'variability_ppm': floor / detectability.VARIABILITY_FLOOR_FRACTION}])
+    # Ks = 10 and a 2 hr eclipse leave the reference noise unscaled
+    results, grid = detectability.compute_detectability(targets, reference_noise=visit_noise, n_samples=50)
+
+    assert results['depth_ppm_median'].iloc[0] == pytest.approx(D)
+    assert results['min_visits'].iloc[0] == 13
+    assert not results['floor_limited'].iloc[0]
+    assert np.array_equal(grid['detection_probability'][0], (grid['visits'] >= 13).astype(float))
+
+
+def test_min_visits_is_first_visit_count_reaching_probability():
+    targets = _targets([{**ERRORS, 'ks_mag': ks} for ks in (9.0, 11.0, 13.0)])
+    results, grid = detectability.compute_detectability(targets, n_samples=500)
+    for i, min_visits in enumerate(results['min_visits']):
+        detected = grid['detection_probability'][i] >= detectability.DETECTION_PROBABILITY
+        if pd.isna(min_visits):
+            assert not detected.any()
+        else:
+            assert min_visits == grid['visits'][np.argmax(detected)]
+            assert not detected[:min_visits - 1].any()
+    assert results['min_visits'].notna().any()
+
+
+def test_floor_limited_when_depth_below_threshold_times_floor():
+    D = _noiseless_depth()
+    fraction = detectability.VARIABILITY_FLOOR_FRACTION
+    targets = _targets([
+        {'variability_ppm': 0.9 * D / detectability.SIGMA_THRESHOLD / fraction},
+        {'variability_ppm': 1.1 * D / detectability.SIGMA_THRESHOLD / fraction},
+    ])
+    results, _ = detectability.compute_detectability(targets, n_samples=50)
+    assert results['floor_limited'].tolist() == [False, True]
+    assert pd.isna(results['min_visits'].iloc[1])
+
+
+def test_missing_magnitude_gives_no_result_and_no_floor_flag():
+    targets = _targets([{'ks_mag': np.nan}, {'ks_mag': 10.0}])
+    results, grid = detectability.compute_detectability(targets, n_samples=50)
+    assert pd.isna(results['min_visits'].iloc[0])
+    assert not results['floor_limited'].iloc[0]
+    assert np.isnan(grid['detection_probability'][0]).all()
+    assert results['min_visits'].iloc[1] == 1
+
+
+def test_results_do_not_depend_on_chunk_size():
+    targets = _targets([{**ERRORS, 'ks_mag': ks, 'variability_ppm': v}
+                        for ks, v in ((9.0, 500.0), (11.0, 1000.0), (12.0, 2000.0), (np.nan, 100.0))])
+    reference, reference_grid = detectability.compute_detectability(targets, n_samples=300, chunk_size=32)
+    for chunk_size in (1, 3):
+        results, grid = detectability.compute_detectability(targets, n_samples=300, chunk_size=chunk_size)
+        pd.testing.assert_frame_equal(results, reference)
+        np.testing.assert_array_equal(grid['detection_probability'], reference_grid['detection_probability'])
+
+
+def test_sample_depths_match_scalar_monte_carlo():
+    systems = [{**HOT_JUPITER, **ERRORS},
+               {'T_star': 4500.0, 'T_star_err': 150.0, 'R_star': 0.7, 'R_star_err': 0.03,
+                'R_p': 0.3, 'R_p_err': 0.02, 'a': 0.05, 'a_err': 0.002}]
+    n_samples, seed = 2000, 7
+    columns = [np.array([s[k] for s in systems]) for k in
+               ('T_star', 'T_star_err', 'R_star', 'R_star_err', 'R_p', 'R_p_err', 'a', 'a_err')]
+    # calculate_eclipse_depth_distribution draws T*, R*, Rp, a in turn from np.random.seed(seed)
+    normals = np.stack([np.random.RandomState(seed).standard_normal((4, n_samples)) for _ in systems])
+    vectorised = depth.sample_depths_ppm(*columns, n_samples=n_samples, normals=normals)
+
+    for i, system in enumerate(systems):
+        scalar = depth.calculate_eclipse_depth_distribution(
+            {**system, 'name': f'P{i}', 'dataset': 'MCS', 'eclipse_observed': False, 'b_occ_median': 0.5},
+            n_samples=n_samples, random_seed=seed)
+        np.testing.assert_array_equal(vectorised[i], scalar['depth_ppm_samples'])
@@ -0,0 +1,69 @@
+from functools import lru_cache
+
+import numpy as np
+import pytest
+
+from ariel_ts.occultation import ECC_BETA_ALPHA, ECC_BETA_BETA, marginal_probabilities
+
+
+@lru_cache(maxsize=None)
+def _monte_carlo(a_over_rs, k, eccentricity=None, n=2_000_000, seed=1):
+    """Brute-force prior average of the capped geometric probabilities."""
+    rng = np.random.RandomState(seed)
+    if eccentricity is None:
+        # Beta prior truncated at star-grazing periastron, by rejection
+        e_max = 1 - (1 + k) / a_over_rs
+        e = rng.beta(ECC_BETA_ALPHA, ECC_BETA_BETA, 3 * n)
+        e = e[e < e_max][:n]
+    else:
+        e = np.full(n, eccentricity)
+    e_sin_omega = e * np.sin(rng.uniform(0, 2 * np.pi, len(e)))
+    base = (1 + k) / a_over_rs / (1 - e ** 2)
+    p_tra = np.minimum(base * (1 + e_sin_omega), 1)
+    p_occ = np.minimum(base * (1 - e_sin_omega), 1)
+    return p_tra.mean(), p_occ.mean(), np.minimum(p_tra, p_occ).mean() / p_tra.mean()
+
+
+# Few nodes only suffice because u = e^alpha removes the prior's singularity at e = 0
+@pytest.mark.parametrize('n_ecc', [6, 32])
+@pytest.mark.parametrize('a_over_rs, k', [(5.0, 0.1), (3.0, 0.2), (20.0, 0.05)])
+def test_beta_prior_quadrature_matches_monte_carlo(a_over_rs, k, n_ecc):
+    quadrature = marginal_probabilities([a_over_rs], [k], [np.nan], [np.nan], n_ecc=n_ecc)
+    expected = _monte_carlo(a_over_rs, k)
+    for value, reference in zip(quadrature, expected):
+        assert value[0] == pytest.approx(reference, abs=5e-4)
+
+
+def test_measured_eccentricity_marginal_omega_matches_monte_carlo():
+    quadrature = marginal_probabilities([4.0], [0.1], [0.5], [np.nan])
+    expected = _monte_carlo(4.0, 0.1, eccentricity=0.5)
+    for value, reference in zip(quadrature, expected):
+        assert value[0] == pytest.approx(reference, abs=5e-4)
+
+
+def test_circular_limit():
+    a_over_rs = np.array([2.0, 5.0, 50.0])
+    k = np.array([0.05, 0.1, 0.2])
+    prob_transit, prob_occultation, given_transit = marginal_probabilities(
+        a_over_rs, k, np.zeros(3), np.full(3, 90.0))
+    assert prob_transit == pytest.approx((1 + k) / a_over_rs, rel=1e-12)
+    assert prob_occultation == pytest.approx((1 + k) / a_over_rs, rel=1e-12)
+    assert given_transit == pytest.approx(1.0)
+
+
+def test_fixed_eccentricity_and_omega():
+    a_over_rs, k, e, omega = 10.0, 0.1, 0.3, 30.0
+    prob_transit, prob_occultation, given_transit = marginal_probabilities(
+        [a_over_rs], [k], [e], [omega])
+    base = (1 + k) / a_over_rs / (1 - e ** 2)
+    e_sin_omega = e * np.sin(np.radians(omega))
+    assert prob_transit[0] == pytest.approx(base * (1 + e_sin_omega))
+    assert prob_occultation[0] == pytest.approx(base * (1 - e_sin_omega))
+    assert given_transit[0] == pytest.approx((1 - e_sin_omega) / (1 + e_sin_omega))
+
+
+def test_no_room_for_eccentricity_is_circular():
+    # a/Rs <= 1 + k leaves e_max = 0; probabilities cap at 1
+    prob_transit, prob_occultation, _ = marginal_probabilities([1.05], [0.1], [np.nan], [np.nan])
+    assert prob_transit[0] == 1.0
+    assert prob_occultation[0] == 1.0
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ariel_ts.query import TargetTable
+
+
+@pytest.fixture
+def table():
+    rng = np.random.RandomState(0)
+    n = 200
+    planets = [f'P{i}' for i in range(n)]
+    p_true = rng.uniform(size=n)
+    p_true[::17] = np.nan
+    mcmc_df = pd.DataFrame({
+        'Planet': planets,
+        'b_occ_median': rng.uniform(0, 1.5, n),
+        'k_rp_rs': np.where(np.arange(n) % 11 == 0, np.nan, rng.uniform(0.01, 0.2, n)),
+        'eclipse_observed': rng.choice(['TRUE', 'FALSE'], n),
+    })
+    regime_df = pd.DataFrame({
+        'Planet': planets,
+        'prob_false_eclipse': 1 - np.nan_to_num(p_true),
+        'prob_grazing_eclipse': 0.0,
+        'prob_true_eclipse': p_true,
+        'dominant_regime': rng.choice(['true', 'grazing', 'false'], n),
+    })
+    catalogue_df = pd.DataFrame({
+        'Planet Name': planets,
+        'Max Tier': rng.choice([1, 2, 3], n),
+        'Eclipse Depth [%]': np.where(np.arange(n) % 3 == 0, 0.01, np.nan),
+    })
+    variability_df = pd.DataFrame({
+        'Planet Name': planets,
+        'variability_ppm': rng.uniform(10, 2000, n),
+        'variability_source': 'stellar_type',
+    })
+    detectability_df = pd.DataFrame({
+        'Planet': planets[: n // 2],
+        'min_visits': rng.randint(1, 100, n // 2),
+        'depth_ppm_median': rng.uniform(1, 500, n // 2),
+    })
+    return TargetTable.from_frames(mcmc_df, regime_df, catalogue_df, variability_df,
+                                   detectability_df=detectability_df)
+
+
+def _frame(table):
+    return pd.DataFrame({'Planet': table.planets, **table.columns})
+
+
+def test_indexed_filters_match_brute_force(table):
+    df = _frame(table)
+    result = table.query(tier=2, p_true=(0.3, 0.8), variability=(None, 1000))
+    expected = df[(df['Max Tier'] == 2) & df['prob_true_eclipse'].between(0.3, 0.8)
+                  & (df['variability_ppm'] <= 1000)]
+    assert sorted(result.planets) == sorted(expected['Planet'])
+
+
+@pytest.mark.parametrize('column', ['prob_true_eclipse', 'k_rp_rs'])
+def test_open_range_excludes_nan(table, column):
+    # prob_true_eclipse is indexed, k_rp_rs is not; both must drop NaN rows
+    result = table.query(**{column: (None, None)})
+    assert not np.isnan(result.column(column)).any()
+    assert len(result) == np.isfinite(table.columns[column]).sum()
+    low = table.query(**{column: (0.05, None)})
+    assert len(low) == np.count_nonzero(table.columns[column] >= 0.05)
+
+
+@pytest.mark.parametrize('ascending', [False, True])
+def test_top_k_order_nan_last(table, ascending):
+    result = table.query(by='prob_true_eclipse', ascending=ascending)
+    values = result.column('prob_true_eclipse')
+    valid = values[np.isfinite(values)]
+    assert np.isnan(values[len(valid):]).all()
+    assert np.array_equal(valid, np.sort(valid) if ascending else np.sort(valid)[::-1])
+    assert len(table.query(by='prob_true_eclipse', top=5)) == 5
+
+
+def test_depth_falls_back_to_detectability_then_catalogue(table):
+    sources = table.columns['eclipse_depth_source']
+    depth = table.columns['eclipse_depth_ppm']
+    assert (sources[:100] == 'detectability').all()
+    assert depth[100:][sources[100:] == 'catalogue'] == pytest.approx(100.0)
+    assert np.isnan(depth[sources == '']).all()
+
+
+def test_ranking_column_checks(table):
+    with pytest.raises(ValueError):
+        table.query(by='dominant_regime')
+    with pytest.raises(KeyError):
+        table.query(by='not_a_column')